@@ -11,11 +11,13 @@
 """
 
 # Import library
+import time
+start_time = time.perf_counter()   # process start, for the --profile-startup report
 import query
 import can # code packet for CANbus communication
 import datetime # RTC Real Time Clock
-import time
 import os
+import sys
 from lib import toshiba_SCiB as battery
 
 # Define CANbus communication parameters
@@ -25,6 +27,7 @@ bitrate         = 250000 # Toshiba SCiB speed of CANbus = 250000
 restart         = 100 # the time it takes to restart CANbus communication if it fails (in milisecond)
 timeout         = 2 # the maximum time the master/client will wait for response from slave/server (in seconds)
 interval       = 30 # the period between each subsequent communication routine/loop (in seconds)
+profile_startup = '--profile-startup' in sys.argv   # print the time spent in each startup phase until the first reading
 
 # Define MySQL Database parameters
 mysql_server    = {"host":"******",
@@ -39,13 +42,39 @@ mysql_interval  = 60 # the period between each subsequent update to database (in
 #query.debugging()  # Monitor Modbus communication for debugging
 init = True  # variable to check Modbus initialization
 
+def mark_startup(phase):
+    # Record the end of a startup phase for the --profile-startup report
+    if profile_startup: startup_phase.append([phase, time.perf_counter()])
+startup_phase = []
+
+def report_startup():
+    # Print the time spent in each startup phase (once, after the first reading)
+    global profile_startup
+    if not profile_startup: return
+    profile_startup = False
+    print("<===== startup profile =====>")
+    last = start_time
+    for phase, t in startup_phase:
+        print("{:<20}: {:8.1f} ms".format(phase, (t - last)*1000)); last = t
+    print("{:<20}: {:8.1f} ms".format("total", (last - start_time)*1000))
+    print("")
+
+def canbus_is_up(channel):
+    # Read the SocketCAN interface state from sysfs (bit 0 of flags = IFF_UP), e.g. after the script was restarted
+    try:
+        with open('/sys/class/net/{}/flags'.format(channel), 'r') as f:
+            return int(f.read().strip(), 16) & 0x1 == 0x1
+    except (OSError, ValueError): return False
+
 def setup_canbus():
     global bustype, channel, bitrate
-    # Configure and bring up the SocketCAN network interface
-    os.system('sudo modprobe can && sudo modprobe can_raw') # load SocketCAN related kernel modules
-    os.system('sudo ip link set down {}'.format(channel)) # disable can0 before config to implement changes in bitrate settings
-    os.system('sudo ip link set {} type can bitrate {} restart-ms {}'.format(channel,bitrate,restart)) # configure can0 & set to 250000 bit/s
-    os.system('sudo ip link set up {}'.format(channel)) # enable can0 so configuration take effects
+    # Configure and bring up the SocketCAN network interface, skipped if it is already up (configured by the previous run)
+    if not canbus_is_up(channel):
+        os.system('sudo modprobe can && sudo modprobe can_raw') # load SocketCAN related kernel modules
+        os.system('sudo ip link set down {}'.format(channel)) # disable can0 before config to implement changes in bitrate settings
+        os.system('sudo ip link set {} type can bitrate {} restart-ms {}'.format(channel,bitrate,restart)) # configure can0 & set to 250000 bit/s
+        os.system('sudo ip link set up {}'.format(channel)) # enable can0 so configuration take effects
+    mark_startup("interface")
     client = can.interface.Bus(bustype=bustype, channel=channel, bitrate=bitrate)
     bat = battery.node(name='TOSHIBA BATTERY', client=client, timeout=timeout)
     server = bat
@@ -91,11 +120,13 @@ def update_database(server, timer):
 
 #################################################################################################################
 
+mark_startup("import")
 # Checking the connection CANbus
 while init:
     try:
         # Setup Raspberry Pi as Modbus client/master
         server = setup_canbus()
+        mark_startup("bus")
         print("<===== Connected to CANbus Communication =====>")
         print("")
         init = False
@@ -119,6 +150,7 @@ while not init:
             
         # Send the command to read the measured value and do all other things
         read_canbus(server)
+        if first[1]: mark_startup("first reading"); report_startup()
         timer = datetime.datetime.now()
         query.print_response(server, timer)
 
@@ -11,11 +11,11 @@
 """
 
 import logging
-import pymysql
-import signal
 import datetime
+import time
 import csv
 import os
+import shutil
 
 #################################################################################################################
 # General function for debugging
@@ -26,10 +26,6 @@ def debugging():
     log = logging.getLogger()
     log.setLevel(logging.DEBUG)
 
-def handle_timeout(signum, frame):
-    raise TimeoutError("Execution timed out")
-signal.signal(signal.SIGALRM, handle_timeout)
-
 def get_cpu_temperature():
     # Read CPU temperature from file
     with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
@@ -61,88 +57,159 @@ def print_response(server,timer):
 ## Handle saving data to CSV
 
 # Define the directory of the backup file and the data to be logged
+# Each log is an append-only journal of daily CSV segments: save/<log name>/<YYYY-MM-DD>.csv (each with its header),
+# a segment expires as a whole after log_limit days. save/<log name>/cursor marks the first row not uploaded to MySQL yet
 log_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'save')
 log_limit = 31
+log_fsync = False   # flush every row to the SD card at once (safer on power cuts, but more flash wear)
+log_expired = {}    # {journal directory: date of the last expiry check}
 
 def strval(array):
     # Change an array into a string (used to save array value into MySQL database or CSV)
     string = " ".join(map(str, array))
     return string
 
+def get_journal(filename):
+    # Get the journal directory of a log (e.g. 'modbus_log.csv' -> save/modbus_log/), a log file of the older
+    # single file format only holds rows not uploaded yet, it is moved into the journal as the segment of its last write
+    directory = os.path.join(log_directory, os.path.splitext(filename)[0])
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+        legacy = os.path.join(log_directory, filename)
+        if os.path.exists(legacy):
+            date = datetime.date.fromtimestamp(os.path.getmtime(legacy)).strftime('%Y-%m-%d')
+            os.replace(legacy, os.path.join(directory, date + '.csv'))
+    return directory
+
+def get_segments(directory):
+    # Daily segments of a journal, oldest first
+    return sorted(f for f in os.listdir(directory) if f.endswith('.csv'))
+
+def expire_segments(directory, timer):
+    # Remove the segments older than log_limit days, checked once a day
+    if log_expired.get(directory) == timer.date(): return
+    log_expired[directory] = timer.date()
+    oldest = (timer - datetime.timedelta(days=log_limit)).strftime('%Y-%m-%d')
+    for segment in get_segments(directory):
+        if segment[:10] < oldest: os.remove(os.path.join(directory, segment))
+
 def log_in_csv(title,data,timer,filename):
-    global log_directory, log_limit
     #return
-    file_directory = os.path.join(log_directory,filename)
-    file_exists = True
-    file_empty = True
-    expired_rows_to_delete = None
-    # Check if the file already exist or not
-    try:
-        with open(file_directory, 'r') as file:
-            file_empty = not file.read(1)
-            csv_log = list(csv.reader(file))
-        # Read the line in the CSV file
-        for row, row_data in enumerate(csv_log):
-            if row > 0:
-                csv_date = row_data[0]
-                is_valid_date = True
-                try: datetime.datetime.strptime(csv_date, '%Y-%m-%d %H:%M:%S')
-                except ValueError: is_valid_date = False
-                if is_valid_date:
-                    # Calculate the difference in days
-                    log_date = datetime.datetime.strptime(csv_date, '%Y-%m-%d %H:%M:%S')
-                    # Calculate how long has the data been logged
-                    timediff = (timer - log_date).days
-                    if timediff > log_limit: expired_rows_to_delete.append(row)
-                    else: break
-    except FileNotFoundError: file_exists = False
-    # Remove the expired row then write the updated contents to a new CSV file
-    if expired_rows_to_delete:
-        csv_log = [row_data for row, row_data in enumerate(csv_log) if row not in expired_rows_to_delete]
-        with open(file_directory, 'w') as file:
-            writer = csv.writer(file)
-            writer.writerows(csv_log)
-    # Add new data into csv file ()
-    with open(file_directory, mode='a' if file_exists else 'w', newline='') as file:
+    directory = get_journal(filename)
+    segment = os.path.join(directory, timer.strftime('%Y-%m-%d') + '.csv')
+    new_segment = not os.path.exists(segment)
+    # Append the row to the segment of the day, a new segment starts with the title
+    with open(segment, mode='a', newline='') as file:
         line = csv.writer(file, delimiter =',')
-        if file_empty: line.writerow(title)
+        if new_segment: line.writerow(title)
         data = [strval(d) if isinstance(d,list) else d for d in data]
         line.writerow(data)
+        if log_fsync:
+            file.flush()
+            os.fsync(file.fileno())
+    if new_segment: expire_segments(directory, timer)
+
+def read_cursor(directory):
+    # Get the upload cursor of a journal: [segment, byte offset of the first row not uploaded yet] (the first segment if none)
+    try:
+        with open(os.path.join(directory, 'cursor'), 'r') as file:
+            segment, offset = file.read().split()
+        return [segment, int(offset)]
+    except (OSError, ValueError): return ['', 0]
+
+def save_cursor(directory, cursor):
+    with open(os.path.join(directory, 'cursor.tmp'), 'w') as file:
+        file.write("{} {}".format(*cursor))
+    os.replace(os.path.join(directory, 'cursor.tmp'), os.path.join(directory, 'cursor'))
+
+def export_csv(filename, destination):
+    # Export a journal into one CSV file (the title of the first segment, then every row)
+    directory = get_journal(filename)
+    with open(destination, 'wb') as output:
+        for i, segment in enumerate(get_segments(directory)):
+            with open(os.path.join(directory, segment), 'rb') as file:
+                if i > 0: file.readline()
+                shutil.copyfileobj(file, output)
 
 #################################################################################################################
 ## Interacting with MySQL Database
 
-def connect_mysql(mysql_server,mysql_query,data=None,timeout=2):
+# One persistent connection to every MySQL server ({(host, port, db, user): connection}), so uploads skip the TCP/TLS handshake
+mysql_connection = {}
+upload_batch = 500          # the most rows uploaded in one transaction (executemany)
+upload_bytes = 256*1024     # the most CSV bytes uploaded in one transaction
+upload_row_time = 0.02      # in seconds, time added to the upload timeout for every row of a batch (a slow cellular uplink)
+
+class deadline:
+    # Time limit of one MySQL operation, shared by all of its steps (connect, query, commit) and cancellable from another thread.
+    # It only works through the socket timeouts of the connection, so it is safe in any thread (no SIGALRM)
+    def __init__(self, timeout=2):
+        self._end       = time.monotonic() + timeout
+        self._cancelled = False
+
+    def cancel(self):
+        # The next step of the operation fails at once (e.g. at shutdown), a step in progress stops at its socket timeout
+        self._cancelled = True
+
+    def remaining(self):
+        # Seconds left for the next step, TimeoutError if the deadline is over or cancelled
+        left = self._end - time.monotonic()
+        if self._cancelled: raise TimeoutError("MySQL operation cancelled")
+        if left <= 0: raise TimeoutError("Execution timed out")
+        return left
+
+def handle_mysql_timeout(db,limit):
+    # Bound the socket connect/read/write timeouts of the connection by the time left, PyMySQL applies them on every socket operation
+    db.connect_timeout = db._read_timeout = db._write_timeout = limit.remaining()
+
+def get_mysql(mysql_server,limit):
+    # Get the open connection to a MySQL server, reconnected if the server dropped it (e.g. after an idle timeout or an outage)
+    key = (mysql_server["host"], mysql_server["port"], mysql_server["db"], mysql_server["user"])
+    db = mysql_connection.get(key)
+    if db != None:
+        handle_mysql_timeout(db,limit)
+        db.ping(reconnect=True)
+        return db
+    # Import PyMySQL only when the first upload is due (it is the slowest import at startup)
+    import pymysql
+    # Setup Raspberry Pi as MySQl Database client
+    timeout = limit.remaining()
+    db = pymysql.connect(host=mysql_server["host"], user=mysql_server["user"], password=mysql_server["password"], db=mysql_server["db"], port=mysql_server["port"],
+                         connect_timeout=timeout, read_timeout=timeout, write_timeout=timeout)
+    mysql_connection[key] = db
+    return db
+
+def close_mysql(mysql_server):
+    # Drop the connection to a MySQL server after an error, the next query connects again
+    db = mysql_connection.pop((mysql_server["host"], mysql_server["port"], mysql_server["db"], mysql_server["user"]), None)
+    if db != None:
+        try: db.close()
+        except Exception: pass
+
+def connect_mysql(mysql_server,mysql_query,data=None,timeout=2,many=False,limit=None):
     #return
-    # Set the signal handler for the timeout
-    signal.alarm(timeout)  # Start the timeout countdown
+    # The whole operation gets timeout seconds (or the given deadline object), every step only gets the time left
+    if limit == None: limit = deadline(timeout)
     try:
-        # Setup Raspberry Pi as MySQl Database client
-        with pymysql.connect(host=mysql_server["host"], user=mysql_server["user"], password=mysql_server["password"], db=mysql_server["db"], port=mysql_server["port"]) as db:
-            # Write data in database
+        db = get_mysql(mysql_server,limit)
+        with db.cursor() as cursor:
+            # Write data in database, one row or (with many) a list of rows in one transaction
+            handle_mysql_timeout(db,limit)
             if data:
-                data = [strval(d) if isinstance(d,list) else d for d in data]
-                db.cursor().execute(mysql_query,data)
+                if many: cursor.executemany(mysql_query,[[strval(d) if isinstance(d,list) else d for d in row] for row in data])
+                else: cursor.execute(mysql_query,[strval(d) if isinstance(d,list) else d for d in data])
+                handle_mysql_timeout(db,limit)
                 db.commit()
                 val = True
-                print("<===== Data is sent to database =====>")
+                print("<===== Data is sent to database{} =====>".format(" ({} rows)".format(len(data)) if many else ""))
                 print("")
             else:
-                with db.cursor() as read:
-                    read.execute(mysql_query)
-                    val = read.fetchall()
-        # Reset the alarm as the query completed successfully
-        signal.alarm(0)
+                cursor.execute(mysql_query)
+                val = cursor.fetchall()
         return val
-    except TimeoutError as e:
-        # Handle the timeout error
-        print("problem with MySQL Server:")
-        print(e)
-        print("<===== ===== continuing ===== =====>")
-        print("")
-        return False
     except Exception as e:
-        # Print the error message
+        # Handle the timeout error and print the error message
+        close_mysql(mysql_server)
         print("problem with MySQL Server:")
         print(e)
         print("<===== ===== continuing ===== =====>")
@@ -150,28 +217,32 @@ def connect_mysql(mysql_server,mysql_query,data=None,timeout=2):
         return False
 
 def retry_mysql(mysql_server,mysql_query,filename,timeout=2):
-    global log_directory
     #return
-    file_directory = os.path.join(log_directory,filename)
-    rows_to_delete = []
-    # Check if the file already exist or not
-    try:
-        with open(file_directory, 'r') as file:
-            csv_log = list(csv.reader(file))
-        # Read the line in the CSV file
-        for row, row_data in enumerate(csv_log):
-            if row > 0:
-                # Retry uploading the data to mysql
-                upload_succeed = connect_mysql(mysql_server,mysql_query,row_data,timeout)
-                if upload_succeed: rows_to_delete.append(row)
-                else: break
-    except FileNotFoundError: pass
-    # Write the updated contents to a new CSV file
-    if rows_to_delete:
-        csv_log = [row_data for row, row_data in enumerate(csv_log) if row not in rows_to_delete]
-        with open(file_directory, 'w') as file:
-            writer = csv.writer(file)
-            writer.writerows(csv_log)
+    directory = get_journal(filename)
+    cursor = read_cursor(directory)
+    uploaded = 0
+    # Upload the rows after the cursor in order, in transactions of up to upload_batch rows and upload_bytes bytes.
+    # The timeout of a transaction grows with its rows. The cursor moves after every uploaded transaction and the upload
+    # stops at the first failure (get the uploaded rows)
+    for segment in get_segments(directory):
+        if segment < cursor[0]: continue
+        if segment > cursor[0]: cursor = [segment, 0]
+        with open(os.path.join(directory, segment), 'rb') as file:
+            if cursor[1] == 0: file.readline()  # the title
+            else: file.seek(cursor[1])
+            while True:
+                rows, size, end = [], 0, file.tell()
+                for line in iter(file.readline, b''):
+                    if not line.endswith(b'\n'): break   # a row still being written
+                    rows.append(next(csv.reader([line.decode('utf-8')])))
+                    size, end = size + len(line), file.tell()
+                    if len(rows) >= upload_batch or size >= upload_bytes: break
+                if not rows: break
+                if not connect_mysql(mysql_server,mysql_query,rows,many=True,limit=deadline(timeout + len(rows)*upload_row_time)): return uploaded
+                cursor = [segment, end]
+                save_cursor(directory, cursor)
+                uploaded += len(rows)
+    return uploaded
 
 def limit_db_rows(mysql_server,row_limit,timeout=2):
     mysql_query = ("DELETE FROM {} WHERE id NOT IN ( SELECT id FROM ( "
@@ -25,19 +25,30 @@ status_path = os.path.join(backup_path,'status.txt')
 keyword_path = os.path.join(backup_path, 'keyword.txt')
 zip_path = os.path.join(code_path,'iot_save.zip')
 
-def copy_csv_files(source_dir, destination_dir):
-    # Get the list of CSV files in the source directory
-    csv_files = [file for file in os.listdir(source_dir) if file.endswith('.csv')]
+backup_extension = ('.csv', '.arc')   # CSV logs and the daily files of the columnar archives
 
-    # Create the destination directory if it doesn't exist
-    if not os.path.exists(destination_dir):
-        os.makedirs(destination_dir)
+def copy_save_files(source_dir, destination_dir):
+    # Copy every CSV and archive file in the source directory and its subdirectories (e.g. the daily segments of a log journal),
+    # keeping the same folder structure in the destination directory. A file already copied and not changed since is skipped,
+    # so only the files of the last days are copied again
+    for root, dirs, files in os.walk(source_dir):
+        save_files = [file for file in files if file.endswith(backup_extension)]
+        if not save_files: continue
+        target_dir = os.path.join(destination_dir, os.path.relpath(root, source_dir))
 
-    # Copy each CSV file to the destination directory
-    for csv_file in csv_files:
-        source_path = os.path.join(source_dir, csv_file)
-        destination_path = os.path.join(destination_dir, csv_file)
-        shutil.copy(source_path, destination_path)
+        # Create the destination directory if it doesn't exist
+        if not os.path.exists(target_dir):
+            os.makedirs(target_dir)
+
+        # Copy each changed file to the destination directory (with its modification time)
+        for save_file in save_files:
+            source_path = os.path.join(root, save_file)
+            destination_path = os.path.join(target_dir, save_file)
+            source_stat = os.stat(source_path)
+            if os.path.exists(destination_path):
+                destination_stat = os.stat(destination_path)
+                if destination_stat.st_size == source_stat.st_size and destination_stat.st_mtime == source_stat.st_mtime: continue
+            shutil.copy2(source_path, destination_path)
 
 def compress_backup():
     # Compress the folder to a ZIP file with password
@@ -58,12 +69,12 @@ def compress_backup():
                 zipf.write(dir_path, arcname=os.path.relpath(dir_path,source_path))
 
 def compile_all_csv():
-    # Copy all the csv files from the directories in jobs.txt list into one folder
+    # Copy all the csv and archive files from the directories in jobs.txt list into one folder
     with open(jobs_path, 'rb') as file:
         for line in file:
             source_dir = os.path.join(line.rstrip().decode().split(' ')[1],'save')
             destination_dir = os.path.join(backup_path,'save',os.path.basename(os.path.dirname(source_dir)))
-            copy_csv_files(source_dir, destination_dir)
+            copy_save_files(source_dir, destination_dir)
 
 def copy_to_usb():
     # Read the keyword inside the usb_path
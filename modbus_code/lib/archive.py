@@ -0,0 +1,220 @@
+"""
+#title           :archive.py
+#description     :long-term on-device history in daily columnar files: delta-encoded timestamps, fixed-point integer columns
+#                 (digits of each register's round) and zlib/lzma compressed blocks, a reader decompresses only one column
+#author          :Nicholas Putra Rihandoko, Nauval Chantika
+#date            :2026/10/18
+#version         :0.1
+#usage           :Energy Monitoring System
+#notes           :fed on every poll, kept archive_limit days (the CSV journal only keeps log_limit days)
+#python_version  :3.7.3
+#==============================================================================
+"""
+import os
+import sys
+import json
+import zlib
+import lzma
+import struct
+import datetime
+from array import array
+from itertools import accumulate, chain
+
+# Block of a daily file (save/<archive>/YYYY-MM-DD.arc), blocks are only appended:
+#   header  : magic b"NIWA", codec, number of rows, length of the directory (struct "<4sBII")
+#   directory: JSON {"column":[names], "digits":[decimal digits], "base":[first values], "type":[array typecodes], "size":[compressed section sizes]}
+#   sections: one compressed array per column, "time" first (epoch milliseconds)
+# A value is stored as the integer round(value * 10**digits). The first present value of a column is its base in the directory,
+# its section holds the differences to the previous present value (the base for the first one), a missing value (None)
+# is the smallest number of the typecode. So a section of small changes fits the smallest typecode, even for epoch milliseconds
+# The rows of the block being filled are also appended to <archive>/staging (one JSON row per line) and taken back after a restart
+magic = b"NIWA"
+header_format = "<4sBII"
+header_size = struct.calcsize(header_format)
+codecs = {"none":0, "zlib":1, "lzma":2}
+typecodes = ["b", "h", "i", "q"]   # the smallest one holding every difference of a section is used
+archive_limit = 366   # days of history kept on the SD card
+
+def compress(codec, data, level):
+    if codec == 1: return zlib.compress(data, level)
+    if codec == 2: return lzma.compress(data, preset=level)
+    return data
+
+def decompress(codec, data):
+    if codec == 1: return zlib.decompress(data)
+    if codec == 2: return lzma.decompress(data)
+    return data
+
+def encode_column(value, digits):
+    # Get [base, typecode, bytes] of the fixed-point delta encoding of a list of values (None = missing)
+    factor, base, delta = 10**digits, None, []
+    for v in value:
+        if v == None: delta.append(None); continue
+        v = int(round(v * factor))
+        if base == None: base = prev = v
+        delta.append(v - prev)
+        prev = v
+    present = [d for d in delta if d != None] or [0]
+    low, high = min(present), max(present)
+    for typecode in typecodes:
+        bits = 8*array(typecode).itemsize
+        if -2**(bits-1) < low and high < 2**(bits-1): break
+    null = -2**(8*array(typecode).itemsize-1)
+    data = array(typecode, [null if d == None else d for d in delta])
+    if sys.byteorder == "big": data.byteswap()
+    return base or 0, typecode, data.tobytes()
+
+def decode_column(typecode, data, digits, base=0):
+    # Get the values of a section (floats with digits, integers without, None if missing)
+    delta = array(typecode)
+    delta.frombytes(data)
+    if sys.byteorder == "big": delta.byteswap()
+    null = -2**(8*delta.itemsize-1)
+    if null not in delta: value = list(accumulate(chain((base,), delta)))[1:]
+    else:
+        value, prev = [], base
+        for d in delta:
+            if d == null: value.append(None)
+            else: prev += d; value.append(prev)
+    if digits == 0: return value
+    factor = 10**digits
+    return [None if v == None else round(v / factor, digits) for v in value]
+
+def read_blocks(f):
+    # Get [offset, rows, codec, directory, first section offset] of every complete block of an open daily file,
+    # a torn block at the end (power cut during a write) ends the list
+    blocks, offset = [], 0
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    while offset + header_size <= end:
+        f.seek(offset)
+        mark, codec, rows, length = struct.unpack(header_format, f.read(header_size))
+        if mark != magic or offset + header_size + length > end: break
+        try: directory = json.loads(f.read(length).decode())
+        except ValueError: break
+        start = offset + header_size + length
+        if start + sum(directory["size"]) > end: break
+        blocks.append([offset, rows, codec, directory, start])
+        offset = start + sum(directory["size"])
+    return blocks
+
+def read_column(path, column):
+    # Get [epoch seconds, values] of one column of a daily file, only the time and that column are decompressed.
+    # The rows of a block without the column get None
+    times, values = [], []
+    with open(path, 'rb') as f:
+        for offset, rows, codec, directory, start in read_blocks(f):
+            section = {}
+            base = directory.get("base", [0]*len(directory["column"]))
+            for name, digits, b, typecode, size in zip(directory["column"], directory["digits"], base, directory["type"], directory["size"]):
+                if name in ("time", column):
+                    f.seek(start)
+                    section[name] = decode_column(typecode, decompress(codec, f.read(size)), digits, b)
+                start += size
+            times += section["time"]
+            values += section.get(column, [None]*rows)
+    return times, values
+
+def read_history(directory, column, first=None, last=None):
+    # Get [epoch seconds, values] of one column over the daily files from the date first to last ('YYYY-MM-DD', None = unbounded)
+    times, values = [], []
+    for name in sorted(f for f in os.listdir(directory) if f.endswith('.arc')):
+        if (first != None and name[:10] < first) or (last != None and name[:10] > last): continue
+        t, v = read_column(os.path.join(directory, name), column)
+        times += t; values += v
+    return times, values
+
+class writer:
+    # Columnar archive of signals: {column: [node index, attribute name]}, fed from the node objects on every poll.
+    # The rows are kept in memory and written as one compressed block of every column after block rows, at midnight
+    # (a new daily file) and by flush() (at shutdown). Until then every row is also appended to the staging file,
+    # so a power cut or a kill only loses the rows the OS did not write yet
+    def __init__(self,signal,directory,block=900,codec="zlib",level=6,limit=archive_limit):
+        self._signal    = signal
+        self._directory = directory
+        self._block     = block
+        self._codec     = codecs[codec]
+        self._level     = level
+        self._limit     = limit
+        self._digits    = None  # [digits of each column], from the registers of the first fed nodes
+        self._date      = None  # date of the buffered rows
+        self._expired   = None  # date of the last expiry check
+        self._rows      = {s: [] for s in ["time"] + list(signal)}
+        self._staging   = None  # staging file, opened by the first row
+
+    def open_staging(self):
+        # Open <archive>/staging, the rows left by the last run (same columns) are taken back into the buffer
+        path = os.path.join(self._directory, 'staging')
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(path, 'r') as f: lines = f.read().splitlines()
+            head = json.loads(lines[0])
+            if head["column"] == list(self._rows):
+                self._digits = head["digits"]
+                for line in lines[1:]:
+                    try: row = json.loads(line)
+                    except ValueError: break    # a row cut by a power cut
+                    for s, v in zip(self._rows, row): self._rows[s].append(v)
+                if self._rows["time"]: self._date = datetime.date.fromtimestamp(self._rows["time"][0])
+        except (OSError, ValueError, IndexError, KeyError): pass
+        try: self._staging = open(path, 'w')
+        except OSError as e: print(" -- archive staging file is not opened: {} --".format(e))
+        self.write_staging(0)
+
+    def write_staging(self,first):
+        # Append the buffered rows from the index first to the staging file (buffered by the OS, no fsync), first = 0 rewrites
+        # the file with its header
+        if self._staging == None: return
+        try:
+            if first == 0:
+                self._staging.seek(0); self._staging.truncate()
+                self._staging.write(json.dumps({"column":list(self._rows), "digits":self._digits}) + "\n")
+            for i in range(first, len(self._rows["time"])): self._staging.write(json.dumps([self._rows[s][i] for s in self._rows]) + "\n")
+            self._staging.flush()
+        except OSError as e: print(" -- archive staging file is not written: {} --".format(e))
+
+    def feed(self,server,timer):
+        # Buffer one row of every signal from the node objects (after a poll at the datetime timer)
+        if self._digits == None:
+            self._digits = [3] + [server[index].get_digits(attr) for index, attr in self._signal.values()]
+        if self._staging == None: self.open_staging()
+        if self._date != None and timer.date() != self._date: self.flush()
+        self._date = timer.date()
+        self._rows["time"].append(timer.timestamp())
+        for s, (index, attr) in self._signal.items():
+            value = getattr(server[index], attr, None)
+            self._rows[s].append(value if isinstance(value, (int, float)) else None)
+        self.write_staging(len(self._rows["time"])-1)
+        if len(self._rows["time"]) >= self._block: self.flush()
+
+    def flush(self):
+        # Append the buffered rows to the daily file as one block
+        if not self._rows["time"]: return
+        column, base, size, kind, section = list(self._rows), [], [], [], []
+        for s, digits in zip(column, self._digits):
+            b, typecode, data = encode_column(self._rows[s], digits)
+            data = compress(self._codec, data, self._level)
+            base.append(b); kind.append(typecode); size.append(len(data)); section.append(data)
+        directory = json.dumps({"column":column, "digits":self._digits, "base":base, "type":kind, "size":size}).encode()
+        path = os.path.join(self._directory, self._date.strftime('%Y-%m-%d') + '.arc')
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(path, 'ab+') as f:
+                # Cut a torn block left by a power cut, the new block must follow the last complete one
+                blocks = read_blocks(f)
+                end = blocks[-1][4] + sum(blocks[-1][3]["size"]) if blocks else 0
+                if f.seek(0, os.SEEK_END) != end: f.truncate(end)
+                f.write(struct.pack(header_format, magic, self._codec, len(self._rows["time"]), len(directory)) + directory + b"".join(section))
+        except OSError as e: print(" -- archive block is not saved: {} --".format(e))
+        self._rows = {s: [] for s in column}
+        self.write_staging(0)
+        self.expire()
+
+    def expire(self):
+        # Remove the daily files older than self._limit days, checked once a day
+        today = datetime.date.today()
+        if self._expired == today: return
+        self._expired = today
+        oldest = (today - datetime.timedelta(days=self._limit)).strftime('%Y-%m-%d')
+        for name in os.listdir(self._directory):
+            if name.endswith('.arc') and name[:10] < oldest: os.remove(os.path.join(self._directory, name))
@@ -0,0 +1,144 @@
+"""
+#title           :modbus_metrics.py
+#description     :in-process registry of modbus transaction metrics (latency histograms, error counters, bytes, retries)
+#author          :Nicholas Putra Rihandoko, Nauval Chantika
+#date            :2026/10/18
+#version         :0.1
+#usage           :Energy Monitoring System
+#notes           :recorded by modbus_node for every command, dumped to a JSON file or served on a unix socket
+#python_version  :3.7.3
+#==============================================================================
+"""
+import os
+import json
+import time
+import socket
+import threading
+from bisect import bisect_left
+
+# Upper bounds of the latency histogram buckets (in milliseconds), the last bucket counts every slower command
+latency_bounds = [5, 10, 20, 50, 100, 200, 500, 1000, 2000]
+# Result of a command: "ok", "timeout" (no response), "crc" (corrupt or undecodable frame),
+# "exception" (Modbus exception response from the device) or "error" (anything else)
+outcomes = ["ok", "timeout", "crc", "exception", "error"]
+
+# {device name: metrics}, every device metrics also keeps {"block": {block name: metrics}} of its commands
+registry = {}
+started = time.time()
+# Other gauges of the gateway, {name: dict updated in place} (e.g. the upload queue), the keys of each dict must not change
+gauge = {}
+# New keys are only added under this lock, so a snapshot never sees a dict changing size
+lock = threading.Lock()
+
+def new_metrics():
+    m = {o: 0 for o in outcomes}
+    m.update({"request":0, "retry":0, "bytes_sent":0, "bytes_received":0,
+              "latency_ms":[0]*(len(latency_bounds)+1), "latency_sum_ms":0.0, "latency_max_ms":0.0})
+    return m
+
+def get_device(name):
+    # Get (or create) the metrics of a device, a node keeps it so recording skips the lookup
+    with lock:
+        if name not in registry:
+            registry[name] = new_metrics()
+            registry[name].update({"offline":False, "offline_count":0, "block":{}})
+    return registry[name]
+
+def classify(response, error=None):
+    # Sort the response (or the raised error) of a pymodbus request into one of the outcomes, without importing pymodbus.
+    # pymodbus reports a timeout or a bad frame as a returned or raised ModbusIOException, told apart by its message
+    if error == None and response != None and not isinstance(response, Exception):
+        if not response.isError(): return "ok"
+        if hasattr(response, "exception_code"): return "exception"
+    elif error == None: error = response
+    if error == None: return "timeout"
+    text = "{} {}".format(type(error).__name__, error).lower()
+    # A silent device: pymodbus words it "No Response received from the remote slave/Unable to decode response",
+    # so "decode" only means a bad frame when there is no "no response"
+    if "no response" in text or "timeout" in text or "timed out" in text: return "timeout"
+    # A ModbusIOException returned in place of a response means no frame came back at all, however it is worded
+    if error is response and type(error).__name__ == "ModbusIOException" and "crc" not in text: return "timeout"
+    if "crc" in text or "check" in text or "invalid" in text or "decode" in text: return "crc"
+    if "ioexception" in text: return "timeout"
+    return "error"
+
+def frame_bytes(fc, count, outcome):
+    # RTU frame sizes of a command (slave address, function code, data and 2 bytes CRC): [request, response]
+    if fc == 0x03 or fc == 0x04: sent, received = 8, 5 + 2*count
+    elif fc == 0x06: sent, received = 8, 8
+    else: sent, received = 9 + 2*count, 8
+    if outcome == "exception": received = 5
+    elif outcome != "ok": received = 0
+    return sent, received
+
+def record(device, block, fc, count, elapsed, outcome, retry=0):
+    # Record one command of a device (from get_device()) on the device and on its block, elapsed in seconds
+    if block not in device["block"]:
+        with lock: device["block"].setdefault(block, new_metrics())
+    ms = elapsed*1000
+    bucket = bisect_left(latency_bounds, ms)
+    sent, received = frame_bytes(fc, count, outcome)
+    for m in (device, device["block"][block]):
+        m["request"] += 1
+        m[outcome] += 1
+        m["retry"] += retry
+        m["bytes_sent"] += sent
+        m["bytes_received"] += received
+        m["latency_ms"][bucket] += 1
+        m["latency_sum_ms"] += ms
+        if ms > m["latency_max_ms"]: m["latency_max_ms"] = ms
+
+def snapshot():
+    # Get every metrics as a JSON string
+    with lock:
+        return json.dumps({"started":started, "time":time.time(), "latency_bounds_ms":latency_bounds, "device":registry, "gauge":gauge})
+
+def dump(path):
+    # Write the metrics to a JSON file, replaced at once so a reader never sees half of it
+    try:
+        with open(path + ".tmp", "w") as f: f.write(snapshot())
+        os.replace(path + ".tmp", path)
+    except OSError as e: print(" -- metrics are not dumped: {} --".format(e))
+
+def serve(path):
+    # Serve the metrics on a unix socket in a daemon thread, every connection gets one JSON snapshot (e.g. 'nc -U path').
+    # Get the server socket (None if it cannot be bound)
+    try: os.unlink(path)
+    except OSError: pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        server.listen(1)
+    except OSError as e:
+        # A read-only or missing directory only costs the metrics socket, never the polling
+        print(" -- metrics socket is not served: {} --".format(e))
+        server.close()
+        return None
+    def handle_connection():
+        while True:
+            conn, _ = server.accept()
+            try: conn.sendall(snapshot().encode())
+            except OSError: pass
+            finally: conn.close()
+    threading.Thread(target=handle_connection, daemon=True).start()
+    return server
+
+def check_classify():
+    # Check the outcome of the pymodbus error messages a gateway sees (python modbus_metrics.py)
+    class ModbusIOException(Exception): pass
+    cases = [[ModbusIOException("Modbus Error: [Input/Output] No Response received from the remote slave/Unable to decode response"), "timeout"],
+             [ModbusIOException("Modbus Error: [Input/Output] No Response received from the remote slave"), "timeout"],
+             [ModbusIOException("Modbus Error: [Input/Output] CRC check failed"), "crc"],
+             [ModbusIOException("Modbus Error: [Input/Output] Unable to decode request"), "crc"],
+             [ModbusIOException("Modbus Error: [Input/Output] Unable to decode response"), "timeout", True],
+             [TimeoutError("timed out"), "timeout"],
+             [ValueError("something else"), "error"]]
+    # [error, outcome, returned as the response instead of raised]
+    for case in cases:
+        error, outcome = case[0], case[1]
+        result = classify(error) if len(case) > 2 else classify(None, error)
+        assert result == outcome, "{} -> {}, expected {}".format(error, result, outcome)
+    print(" -- {} error messages classified as expected --".format(len(cases)))
+
+if __name__ == "__main__":
+    check_classify()
@@ -0,0 +1,771 @@
+"""
+#title           :modbus_node.py
+#description     :shared modbus engine for every device library, a device library only declares its register map (profile)
+#author          :Nicholas Putra Rihandoko, Nauval Chantika
+#date            :2026/10/18
+#version         :0.1
+#usage           :Energy Monitoring System
+#notes           :
+#python_version  :3.7.3
+#==============================================================================
+"""
+import os
+import sys
+import time
+import struct
+import marshal
+import hashlib
+import random
+from array import array
+from . import modbus_metrics as metrics
+
+# A device profile is a register map of two dicts:
+# memory_dict = {name: {"fcr", "fcw", "address", "scale", "bias", "round", optional "param", "period", "signed"}}
+#               ("fc" is accepted in place of "fcr"/"fcw", it is sorted as a read or write function code)
+# extra_calc  = {name: {"compile":[nested list of names]}} or
+#               {name: {"scale", "bias", "round", "limit", "scale_dep":[[power, name], ...], "bias_dep":[[constant, name], ...]}}
+
+# Registered device profiles, {profile name: (memory_dict, extra_calc)}
+profiles = {}
+# Validated and precompiled profiles, {(profile name, address shift): compiled profile}
+compiled = {}
+# Compiled profiles are also cached on disk ({profile name: cache file}), so a restart skips validating and compiling them
+cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+cache_file = {}
+# Hash of this engine's source, part of the cache key, so a changed compiler (e.g. get_profile(), compile_calculation()) never loads a stale cache
+try:
+    with open(__file__, "rb") as f: engine_digest = hashlib.sha1(f.read()).hexdigest()
+except OSError: engine_digest = None
+
+def register_profile(name,memory_dict,extra_calc):
+    # Validate a device profile once and register it under its name, a broken register map fails at import instead of while polling.
+    # A profile that is unchanged since the last start is loaded from the cache (keyed by the hash of its register map and of the engine) instead
+    profiles[name] = (memory_dict, extra_calc)
+    for key in [k for k in compiled if k[0] == name]: del compiled[key]
+    digest = hashlib.sha1(marshal.dumps((sys.version_info[:2], engine_digest, memory_dict, extra_calc))).hexdigest()
+    cache_file[name] = os.path.join(cache_dir, "{}-{}.marshal".format(name, digest[:16]))
+    try:
+        with open(cache_file[name], "rb") as f: cache = marshal.loads(f.read())
+        for shift, profile in cache.items():
+            profile["extra_calc"] = extra_calc
+            compiled[(name, shift)] = profile
+    except (OSError, EOFError, ValueError, TypeError):
+        validate_profile(name,memory_dict,extra_calc)
+    return name
+
+def save_profile_cache(name):
+    # Write every compiled address shift of a profile to its cache file (skipped if the storage is read-only)
+    cache = {}
+    for (n, shift), profile in compiled.items():
+        if n == name: cache[shift] = {k: v for k, v in profile.items() if k != "extra_calc"}
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Remove the cache of older versions of this profile, then write a new file and swap it in at once
+        for old in os.listdir(cache_dir):
+            if old.startswith(name+"-") and os.path.join(cache_dir, old) != cache_file[name]: os.remove(os.path.join(cache_dir, old))
+        with open(cache_file[name]+".tmp", "wb") as f: f.write(marshal.dumps(cache))
+        os.replace(cache_file[name]+".tmp", cache_file[name])
+    except OSError as e:
+        print(" -- cannot write the profile cache:", e, "--")
+
+def validate_profile(name,memory_dict,extra_calc):
+    # Check every register and calculated parameter of a device profile
+    error = []
+    for key, value in memory_dict.items():
+        if "address" not in value: error.append(key+": no address")
+        if "fc" not in value and ("fcr" not in value or "fcw" not in value): error.append(key+": no fcr/fcw (or fc)")
+        read = value.get("fcr", value.get("fc")) in (0x03, 0x04)
+        missing = [k for k in ("scale", "bias", "round") if k not in value]
+        if read and missing: error.append(key+": no "+"/".join(missing))
+        if value.get("period", "normal") not in ("fast", "normal", "slow", "boot"): error.append(key+": unknown period "+str(value["period"]))
+    for key, value in extra_calc.items():
+        if value.get("compile") is not None:
+            names = [value["compile"]]
+            while names and isinstance(names[0], list): names = [n for row in names for n in row]
+            depend = [n for n in names if isinstance(n, str)]
+        else:
+            missing = [k for k in ("scale", "bias", "round", "limit", "scale_dep", "bias_dep") if k not in value]
+            if missing:
+                error.append(key+": no "+"/".join(missing)); continue
+            depend = [d[1] for d in value["scale_dep"] + value["bias_dep"]]
+        for d in depend:
+            if d not in memory_dict and d not in extra_calc: error.append(key+": unknown dependency "+d)
+    if error: raise ValueError("invalid modbus profile '"+name+"': "+", ".join(error))
+
+def compile_calculation(extra_calc):
+    # Compile extra_calc once into an evaluation plan sorted by dependency, so chained parameters
+    # (e.g. DC_Current_raw -> DC_Current) are always calculated after the parameters they depend on
+    inputs = {}
+    for key, value in extra_calc.items():
+        if value.get("compile") is not None:
+            shape, level, names = [], value["compile"], value["compile"]
+            while isinstance(level, list): shape.append(len(level)); level = level[0]
+            for _ in shape[1:]: names = [n for row in names for n in row]
+            names = [n if isinstance(n, str) else None for n in names]
+            inputs[key] = {"key":key, "input":set(n for n in names if n), "names":names, "shape":shape}
+        else:
+            inputs[key] = {"key":key, "input":set(d[1] for d in value["scale_dep"] + value["bias_dep"]),
+                           "scale_dep":[tuple(d) for d in value["scale_dep"]], "bias_dep":[tuple(d) for d in value["bias_dep"]],
+                           "scale":value["scale"], "bias":value["bias"], "round":value["round"], "limit":value["limit"]}
+        # A parameter depending on itself rescales its own read value, only right after that value is read
+        inputs[key]["self"] = key in inputs[key]["input"]
+    order, done = [], set()
+    while len(order) < len(inputs):
+        ready = [k for k in inputs if k not in done and all(d == k or d in done or d not in inputs for d in inputs[k]["input"])]
+        if not ready:
+            print(" -- circular dependency in extra calculation, kept in declared order:", [k for k in inputs if k not in done], "--")
+            ready = [k for k in inputs if k not in done]
+        order.extend(ready); done.update(ready)
+    return [inputs[k] for k in order]
+
+def get_profile(name,shift=0):
+    # Get the precompiled profile of a device for an address shift, compiled once and shared by every node using it
+    if (name, shift) not in compiled:
+        memory_dict, extra_calc = profiles[name]
+        memory = {}
+        for key, value in memory_dict.items():
+            value = dict(value)
+            # Used to shift the Modbus memory address for some devices
+            value["address"] += shift
+            if "fc" in value:
+                fc = value.pop("fc")
+                value["fcr"] = fc if fc in (0x03, 0x04) else None
+                value["fcw"] = fc if fc in (0x06, 0x10) else None
+            memory[key] = value
+        # Fixed schema of the array storage, one slot for each memory address and each calculated (non compile) parameter
+        slot = list(memory) + [k for k, v in extra_calc.items() if v.get("compile") is None and k not in memory]
+        # Lookup of the register name by its lower case name or address (the first declared wins) and its declared order
+        index = {}
+        for key, value in memory.items():
+            index.setdefault(key.lower(), key); index.setdefault(value["address"], key)
+        compiled[(name, shift)] = {"memory_dict":memory, "extra_calc":extra_calc, "calc_plan":compile_calculation(extra_calc),
+                                   "slot":{n: i for i, n in enumerate(slot)}, "index":index, "order":{k: i for i, k in enumerate(memory)}}
+        save_profile_cache(name)
+    return compiled[(name, shift)]
+
+class node:
+    _profile = None     # name of the registered device profile, set by every device library
+
+    def __init__(self,slave,name,client,delay=200,max_count=20,increment=1,shift=0,baudrate=9600,storage=None,word_order="big",retries=2,retry_budget=6,backoff=20,
+                 offline_after=3,probe_period=5,probe_max=300):
+        self._name                      = name
+        self._slave                     = slave
+        self._client                    = client
+        self._client_transmission_delay = delay/1000    # in seconds
+        self._max_count                 = min(max_count,125)  # maximum read/write address count in a single command (Modbus PDU limit is 125 registers)
+        self._char_time                 = 11/baudrate   # in seconds, one RTU character is 11 bits
+        self._silent_interval           = 3.5*self._char_time   # in seconds, RTU silent interval between frames
+        self._margin                    = self._client_transmission_delay   # in seconds, learned turnaround margin on top of the silent interval
+        self._margin_floor              = 0             # in seconds, the margin does not shrink below a margin that failed
+        self._latency                   = None          # in seconds, smoothed processing time of the device (response time minus the frames on the wire)
+        self._retries                   = retries       # re-reads of a failed read block before it is split into halves
+        self._retry_budget              = retry_budget  # re-sent read commands allowed in one read plan (polling cycle)
+        self._budget                    = retry_budget  # re-sent read commands left in the current read plan
+        self._backoff                   = backoff/1000  # in seconds, first re-read backoff, doubled for every retry and jittered
+        self._offline_after             = offline_after # consecutive timeouts before the node is offline and only probed
+        self._probe_min                 = probe_period  # in seconds, first probe period of an offline node, doubled after every failed probe
+        self._probe_max                 = probe_max     # in seconds, longest probe period
+        self._probe_period              = probe_period
+        self._probe_at                  = 0             # monotonic time of the next probe
+        self._timeouts                  = 0             # consecutive timeouts
+        self._offline                   = False
+        self._shift                     = shift         # address shift
+        self._inc                       = increment     # address increment
+        self._word_order                = word_order    # 32-bit word order with increment 2, "big" = high word first
+        # Register map of the device (already shifted) and the dependency ordered plan of its extra calculation
+        profile = get_profile(self._profile, shift)
+        self._memory_dict               = profile["memory_dict"]
+        self._extra_calc                = profile["extra_calc"]
+        self._calc_plan                 = profile["calc_plan"]
+        self._index                     = profile["index"]
+        self._order                     = profile["order"]
+        # Optional compact storage: every read value is kept in one array('d') indexed by self._slot
+        self._slot, self._values = {}, None
+        if storage == "array": self.build_storage()
+        # Names read since the last extra calculation (None = calculate everything)
+        self._dirty = None
+        # Polling period (in seconds, "boot" = infinite) of the parameters in the polling schedule, see self.compile_schedule()
+        self._period = {}
+        # Transaction metrics of the device (latency, errors, bytes), see modbus_metrics.py
+        self._metrics = metrics.get_device(name)
+
+    def reset_read_attr(self):
+        # Reset (and/or initiate) object's attributes
+        for attr_name, attr_value in vars(self).items():
+            if not attr_name.startswith("_"): setattr(self, attr_name, 0)
+        if self._values is not None:
+            for i, kind in enumerate(self._kind):
+                if kind: self._values[i], self._kind[i] = 0, 2
+        self._dirty = None
+
+    def build_storage(self):
+        # Fixed schema of the array storage (shared by every node of the same profile)
+        self._slot = get_profile(self._profile, self._shift)["slot"]
+        self._values = array('d', [float('nan')]*len(self._slot))   # NaN means None (no data)
+        self._kind = bytearray(len(self._slot))                      # 0 = not read yet, 1 = float or None, 2 = int
+
+    def save_value(self,name,value):
+        # Save a read value into the array storage if it has a slot, otherwise into an object's attribute
+        if self._values is not None and name in self._slot:
+            i = self._slot[name]
+            if value == None: self._values[i], self._kind[i] = float('nan'), 1
+            else: self._values[i], self._kind[i] = value, 2 if isinstance(value, int) else 1
+        else: setattr(self, name, value)
+
+    def __getattr__(self,name):
+        # Attribute-style view of the array storage (only called when a normal attribute is not found)
+        slot = self.__dict__.get("_slot")
+        if slot and name in slot and self._kind[slot[name]]:
+            value = self._values[slot[name]]
+            if value != value: return None
+            return int(value) if self._kind[slot[name]] == 2 else value
+        raise AttributeError(name)
+
+    def get_read_attr(self):
+        # Collect the read values (object's attributes and array storage) as {name: value}
+        attr = {}
+        for name, i in self._slot.items():
+            if self._kind[i]: attr[name] = getattr(self, name)
+        for attr_name, attr_value in vars(self).items():
+            if not attr_name.startswith("_"): attr[attr_name] = attr_value
+        return attr
+
+    def snapshot(self):
+        # Copy the whole device state, a single buffer copy with the array storage
+        if self._values is not None: return array('d', self._values)
+        return self.get_read_attr()
+
+    def get_digits(self,name):
+        # Decimal digits of a parameter (its "round", 0 for a raw register or an unknown name), e.g. the fixed-point precision of the archive
+        value = self._memory_dict.get(name) or self._extra_calc.get(name) or {}
+        return value.get("round") or 0
+
+    def map_read_attr(self,raw_address):
+        # get the attribute data using its Modbus memory address
+        mapped_addr = []
+        for key, value in self._memory_dict.items():
+            for a in raw_address:
+                if value["address"] == a:
+                    try: mapped_addr.append([key, getattr(self, key)])
+                    except: print(" -- one or more mapped address has not been read from server --")
+                    break
+        return mapped_addr
+
+    def handle_extra_calculation(self):
+        # Evaluate the compiled self._extra_calc plan, only for parameters whose inputs were read (or recalculated) since the last call
+        dirty, self._dirty = self._dirty, set()
+        for step in self._calc_plan:
+            key = step["key"]
+            if dirty is not None:
+                if step["self"]:
+                    if key not in dirty: continue
+                elif dirty.isdisjoint(step["input"]): continue
+            if step.get("names") is not None:
+                # Copy the dependency to an array of the same shape as the compile blueprint, assign it to new attribute
+                comp = [None if n == None else getattr(self, n, None) for n in step["names"]]
+                for size in reversed(step["shape"][1:]): comp = [comp[i:i+size] for i in range(0, len(comp), size)]
+                setattr(self, key, comp)
+            else:
+                # Calculate the parameters, assign it to new attribute, skip if dependency not met
+                try:
+                    val = 1
+                    for power, dep in step["scale_dep"]:
+                        dep = getattr(self, dep)
+                        if dep == None or val == None: val = None # For avoid error because of None data
+                        elif dep != 0: val *= dep**power
+                        else: val = 0
+                    for coef, dep in step["bias_dep"]:
+                        dep = getattr(self, dep)
+                        if dep == None or val == None: val = None # For avoid error because of None data
+                        else: val += coef*dep
+                    if val != None:
+                        val = round(val * step["scale"] + step["bias"], step["round"])
+                        if step["limit"] and val:
+                            if val < step["limit"][0]: val = step["limit"][1]
+                    self.save_value(key, val)
+                except AttributeError: continue
+            if dirty is not None: dirty.add(key)
+
+    def coalesce_address(self,address):
+        # Choose the command boundaries of the sorted address with the least total bus time.
+        # Each command costs its frame overhead (8 bytes request, 5 bytes response header, two 3.5 character
+        # silent intervals and the turnaround margin) plus 2 bytes for every register read, including the gaps.
+        # So a small gap is read over, a large gap starts a new command, and no command exceeds max_count.
+        frame = (8 + 5 + 7) * self._char_time + self._margin
+        register = 2 * self._char_time
+        cost, first = [0], [0]
+        for end in range(1, len(address)+1):
+            cost.append(None); first.append(end-1)
+            for start in range(end-1, -1, -1):
+                count = address[end-1] - address[start] + self._inc
+                if count > self._max_count and start < end-1: break
+                c = cost[start] + frame + count*register
+                if cost[end] == None or c < cost[end]: cost[end], first[end] = c, start
+        # Trace back the chosen boundaries
+        blocks, end = [], len(address)
+        while end > 0:
+            blocks.insert(0, [first[end], end]); end = first[end]
+        return blocks
+
+    def count_address(self,fcr,raw_address):
+        # Configure the read address (final_addr) and the attribute name where the read value is saved (final_save)
+        address, final_addr, save, final_save = [], [], [], []
+
+        # Match the address (lower case name or address) with the precompiled index of self._memory_dict library
+        matched, unknown = {}, []
+        for a in raw_address:
+            if a in self._index: matched[self._index[a]] = True
+            elif a not in unknown: unknown.append(a)
+        for key in sorted(matched, key=self._order.get):
+            address.append(self._memory_dict[key]["address"]); save.append(key)
+            if fcr == None: fcr = self._memory_dict[key]["fcr"]
+        raw_address = unknown
+
+        # If the address is not available in the library, then use it as is
+        for a in raw_address:
+            if isinstance(a,str):
+                print(" -- unrecognized address for '{}' --".format(a))
+            else:
+                address.append(a); save.append('Hx'+hex(a)[2:].zfill(4).upper())
+                print(" -- address '{}' may gives raw data, use with discretion --".format(save[-1]))
+
+        # Divide the address to be read into several command based on the bus time of each command
+        address, save = zip(*sorted(zip(address, save)))
+        address, save = list(address), list(save)
+        for start, end in self.coalesce_address(address):
+            final_addr.append(address[start:end]); final_save.append(save[start:end])
+        return fcr, final_addr, final_save
+
+    def compile_decoder(self,count,slots):
+        # Precompile the batch decoder of a read block with count registers and its [offset, name, scale, bias, round, signed] slots:
+        # one struct format unpacking every slot of the whole response at once (2's complement unless "signed" is False,
+        # 32-bit with increment 2) and the per-slot scale, bias and round
+        fmt, pos, field = ">", 0, {}
+        for s in sorted(slots):
+            if s[0] in field: continue
+            code = {1:"h", 2:"i"}[self._inc]
+            fmt += "x"*2*(s[0]-pos) + (code if s[5] else code.upper())
+            field[s[0]], pos = len(field), s[0]+self._inc
+        fmt += "x"*2*(count-pos)
+        return {"pack":struct.Struct(">%dH" % count).pack, "unpack":struct.Struct(fmt).unpack,
+                "index":[field[s[0]] for s in slots], "scale":[s[2] for s in slots],
+                "bias":[s[3] for s in slots], "round":[s[4] for s in slots]}
+
+    def decode_block(self,register,block):
+        # Decode the registers of a whole read block in one pass, in the order of its slots (raw address is kept as is)
+        decoder = block["decoder"]
+        if self._word_order == "little" and self._inc == 2:
+            # Low word first, swap every pair of registers
+            register = list(register)
+            register[0::2], register[1::2] = register[1::2], register[0::2]
+        value = decoder["unpack"](decoder["pack"](*register))
+        return [value[i] if rnd == None else round(value[i] * scale + bias, rnd)
+                for i, scale, bias, rnd in zip(decoder["index"], decoder["scale"], decoder["bias"], decoder["round"])]
+
+    def save_slots(self,value,slots):
+        # Save the decoded values of a read block to object's attributes
+        for s, v in zip(slots, value):
+            self.save_value(s[1], v)
+        if self._dirty is not None: self._dirty.update(s[1] for s in slots)
+
+    def plan_read(self,fcr,address):
+        # Configure the read commands once: request blocks and the slots where each decoded value is saved
+        fcr, addr, save = self.count_address(fcr,address)
+        blocks = []
+        for i, a in enumerate(addr):
+            slots = []
+            for s in save[i]:
+                if s.startswith('Hx'):
+                    slots.append([int(s[2:],16)-a[0], s, 1, 0, None, True])
+                else:
+                    slots.append([self._memory_dict[s]["address"]-a[0], s, self._memory_dict[s]["scale"], self._memory_dict[s]["bias"], self._memory_dict[s]["round"], self._memory_dict[s].get("signed",True)])
+            blocks.append(self.compile_block(fcr,a[0],slots))
+        return {"fc":fcr, "blocks":blocks}
+
+    def compile_block(self,fc,address,slots):
+        # Precompile one read command from its first address and its [offset, name, scale, bias, round, signed] slots
+        count = max(s[0] for s in slots)+self._inc
+        return {"address":address, "count":count, "slots":slots, "decoder":self.compile_decoder(count,slots),
+                "name":"fc{} {:#06x}+{}".format(fc,address,count)}
+
+    def split_block(self,fc,block):
+        # Split a read block into two blocks at its middle register (compiled once), so a bad register only fails its own half.
+        # None if the block only reads one register
+        if "split" not in block:
+            offset = sorted(set(s[0] for s in block["slots"]))
+            if len(offset) < 2: block["split"] = None
+            else:
+                mid = offset[len(offset)//2]
+                block["split"] = [self.compile_block(fc, block["address"], [s for s in block["slots"] if s[0] < mid]),
+                                  self.compile_block(fc, block["address"]+mid, [[s[0]-mid]+s[1:] for s in block["slots"] if s[0] >= mid])]
+        return block["split"]
+
+    def handle_backoff(self,retry):
+        # Backoff before the n-th re-read of a block, jittered so retries do not line up with a periodic noise burst
+        return self._backoff * 2**(retry-1) * random.uniform(0.5, 1.5)
+
+    def compile_read(self,address,fc=None):
+        # Build a reusable read plan for self.execute(), so repeated reads skip address parsing and chunking
+        return self.plan_read(fc, self.handle_read_address(address))
+
+    def handle_turnaround(self,sent,ok,size=0):
+        # Learn the turnaround after a command sent at the monotonic time 'sent' (size = bytes of the request and response frames)
+        # and get the monotonic time the next command may be sent. Only the RTU silent interval plus a margin is waited.
+        # The margin starts at the client delay and shrinks while the device keeps answering, but not below the measured
+        # processing time of the device nor below a margin that failed. It doubles on an error (CRC, timeout or exception
+        # response), but never exceeds the client delay
+        now = time.monotonic()
+        if ok:
+            latency = max(now - sent - size*self._char_time, 0)
+            self._latency = latency if self._latency == None else self._latency + (latency - self._latency)/8
+            self._margin = min(max(self._margin*7/8, self._margin_floor, self._latency), self._client_transmission_delay)
+        else:
+            self._margin = min(max(self._margin*2, self._char_time), self._client_transmission_delay)
+            self._margin_floor = self._margin
+        return now + self._silent_interval + self._margin
+
+    def handle_read_response(self,fc,block,sent,response,error,retry=0):
+        # Save the decoded registers of a read command sent at the monotonic time 'sent' (None on any failure),
+        # record its metrics and get the monotonic time the next command may be sent and the outcome of the command
+        elapsed = time.monotonic() - sent
+        outcome = metrics.classify(response, error)
+        if outcome == "ok":
+            try: self.save_slots(self.decode_block(response.registers,block),block["slots"])
+            except (AttributeError, TypeError, struct.error): outcome = "crc"   # a response without the requested registers
+        if outcome != "ok": self.save_slots([None]*len(block["slots"]), block["slots"])
+        metrics.record(self._metrics, block["name"], fc, block["count"], elapsed, outcome, 1 if retry else 0)
+        self.handle_health(outcome)
+        return self.handle_turnaround(sent, outcome == "ok", sum(metrics.frame_bytes(fc, block["count"], outcome))), outcome
+
+    def handle_health(self,outcome):
+        # Circuit breaker: after self._offline_after consecutive timeouts the node is offline, its reads are skipped (saved as None)
+        # and only probed by self.handle_probe(). Any answer from the device (even an exception response) brings it back online
+        if outcome == "timeout":
+            self._timeouts += 1
+            if not self._offline and self._timeouts >= self._offline_after:
+                self._offline, self._probe_period = True, self._probe_min
+                self._probe_at = time.monotonic() + self._probe_period
+                self._metrics["offline"] = True; self._metrics["offline_count"] += 1
+                print(" -- {} is not responding, polling is paused --".format(self._name))
+        elif outcome != None:
+            self._timeouts = 0
+            if self._offline:
+                self._offline = False
+                self._metrics["offline"] = False
+                print(" -- {} is responding again, polling is resumed --".format(self._name))
+
+    def probe_block(self,plan):
+        # The cheapest read of a read plan, its first register alone (compiled once), to probe an offline node
+        if "probe" not in plan:
+            block = plan["blocks"][0]
+            slot = min(block["slots"])
+            plan["probe"] = self.compile_block(plan["fc"], block["address"]+slot[0], [[0]+slot[1:]])
+        return plan["probe"]
+
+    def handle_probe(self,plan):
+        # Check whether an offline node should be probed with this read plan now, the probe period doubles while it stays offline
+        if not self._offline or not plan["blocks"] or time.monotonic() < self._probe_at: return False
+        self._probe_period = min(self._probe_period*2, self._probe_max)
+        self._probe_at = time.monotonic() + self._probe_period
+        return True
+
+    def read_block(self,fc,block,retry=0):
+        # Send one read command of a read plan and save the decoded registers, get the response and the outcome of the command
+        response, outcome = None, None
+        if fc == 0x03 or fc == 0x04:
+            sent, error = time.monotonic(), None
+            try:
+                if fc == 0x03:
+                    response = self._client.read_holding_registers(address=block["address"], count=block["count"], slave=self._slave)
+                else:
+                    response = self._client.read_input_registers(address=block["address"], count=block["count"], slave=self._slave)
+            except Exception as e: error = e
+            ready, outcome = self.handle_read_response(fc, block, sent, response, error, retry)
+            time.sleep(max(0, ready - time.monotonic()))
+        else: print(" -- function code needs to be declared for this list of read address --")
+        return response, outcome
+
+    def read_block_retry(self,fc,block):
+        # Read a block and re-read it after a backoff if it failed (an exception response is not re-read, the device will
+        # answer the same). If the device still answers with an error, split the block into halves to isolate a bad register
+        # (a timeout is not split, a silent device would not answer a half either). Every re-sent command takes from self._budget.
+        # A block split after an exception response is read as its halves from then on (block["pinned"]), not split again every cycle
+        if block.get("pinned"):
+            response = None
+            for half in block["split"]: response = self.read_block_retry(fc,half) or response
+            return response
+        response, outcome = self.read_block(fc,block)
+        retry = 0
+        while outcome not in ("ok", "exception", None) and retry < self._retries and self._budget > 0 and not self._offline:
+            retry += 1; self._budget -= 1
+            time.sleep(self.handle_backoff(retry))
+            response, outcome = self.read_block(fc,block,retry)
+        if outcome in ("exception", "crc", "error"): response = self.read_block_split(fc,block,outcome) or response
+        return response
+
+    def read_block_split(self,fc,block,outcome):
+        # Read both halves of a failed block, a failed half is split again while the retry budget lasts.
+        # The device answers an exception the same every time, so the halves of such a block are kept (pinned)
+        response = None
+        if self._budget > 0 and self.split_block(fc,block):
+            if outcome == "exception": block["pinned"] = True
+            for half in block["split"]:
+                if self._budget <= 0: break
+                self._budget -= 1
+                r, outcome = self.read_block(fc,half,1)
+                if outcome in ("exception", "crc", "error"): r = self.read_block_split(fc,half,outcome) or r
+                response = r or response
+        return response
+
+    def execute(self,plan):
+        # Run a read plan from self.compile_read(), with a fresh retry budget. The blocks of an offline node are not read
+        response = None
+        self._budget = self._retry_budget
+        if self.handle_probe(plan): response, outcome = self.read_block(plan["fc"],self.probe_block(plan))
+        for block in plan["blocks"]:
+            if self._offline: self.save_slots([None]*len(block["slots"]), block["slots"])
+            else: response = self.read_block_retry(plan["fc"],block) or response
+        self.handle_extra_calculation()
+        return response
+
+    def compile_schedule(self,address,period,fc=None):
+        # Group the read address by the polling period of its "period" class ("fast", "normal", "slow" or "boot";
+        # "normal" if not declared) in self._memory_dict or self._extra_calc. period maps each class to seconds, 0 = once at boot
+        group = {}
+        for a in address:
+            if isinstance(a,str): p = (self._memory_dict.get(a) or self._extra_calc.get(a) or {}).get("period","normal")
+            else: p = "normal"
+            group.setdefault(period[p], []).append(a)
+            if isinstance(a,str): self._period[a] = period[p] or float("inf")
+        return {"fc":fc, "group":group, "due":{p: 0 for p in group}, "plan":{}}
+
+    def is_read(self,address):
+        # Check if every named parameter of a read address list holds a value (a failed or skipped read saves None)
+        return all(getattr(self, a, None) != None for a in address if isinstance(a,str))
+
+    def due_plan(self,schedule,now):
+        # Get one read plan packing every group whose period has elapsed at the monotonic time 'now' (None if nothing is due).
+        # The boot group is retired once a read saved all of its values, until then (a timeout, an offline node at startup)
+        # it is read again on every call
+        if schedule["due"].get(0) == -1 and self.is_read(schedule["group"][0]): schedule["due"][0] = None
+        due = tuple(sorted(p for p, t in schedule["due"].items() if t != None and now >= t))
+        if not due: return None
+        for p in due:
+            if p == 0: schedule["due"][p] = -1      # read, checked by the next call
+            else:
+                # Keep the group on its own time grid, unless it fell behind by a whole period
+                schedule["due"][p] += p
+                if schedule["due"][p] <= now: schedule["due"][p] = now + p
+        # Read plans are compiled once for each combination of due groups
+        if due not in schedule["plan"]:
+            schedule["plan"][due] = self.compile_read([a for p in due for a in schedule["group"][p]], schedule["fc"])
+        return schedule["plan"][due]
+
+    def reading_sequence(self,fcr,address):
+        return self.execute(self.plan_read(fcr,address))
+
+    def handle_multiple_writting(self,param):
+        # convert parameter input into hexadecimal format based on address increment
+        if param < 0: hex_param = hex((abs(param) ^ ((1 << (16*self._inc)) - 1)) + 1)[2:].zfill(4*self._inc)
+        else: hex_param = hex(param)[2:].zfill(4*self._inc)
+        values = [int(hex_param[i:i+4], 16) for i in range(0, 4*self._inc, 4)]
+        return values
+
+    def handle_write_response(self,fcw,address,count,sent,response,error):
+        # Record the metrics of a write command sent at the monotonic time 'sent' and get the monotonic time the next command may be sent
+        elapsed = time.monotonic() - sent
+        outcome = metrics.classify(response, error)
+        metrics.record(self._metrics, "fc{} {:#06x}+{}".format(fcw,address,count), fcw, count, elapsed, outcome)
+        self.handle_health(outcome)
+        return self.handle_turnaround(sent, outcome == "ok", sum(metrics.frame_bytes(fcw, count, outcome)))
+
+    def writting_sequence(self,fcw,address,param):
+        response = None
+        if isinstance(param, list):
+            params = []
+            for p in param: params.extend(self.handle_multiple_writting(p))
+        else: params = self.handle_multiple_writting(param)
+        # Send the command with function_code 0x06 (6) or 0x10 (16)
+        sent, error = time.monotonic(), None
+        try:
+            if fcw == 0x06:
+                response = self._client.write_register(address=address, value=param, slave=self._slave)
+            elif fcw == 0x10:
+                response = self._client.write_registers(address=address, values=params, slave=self._slave)
+        except Exception as e: error = e
+        ready = self.handle_write_response(fcw, address, len(params), sent, response, error)
+        if error != None: raise error
+        time.sleep(max(0, ready - time.monotonic()))
+        return response
+
+    def handle_dependency(self,raw_address):
+        # create list of read address based on the dependent parameters in self._extra_calc
+        result = []
+        for item in raw_address:
+            if isinstance(item, list):
+                result.extend(self.handle_dependency(item))
+            else:
+                if self._extra_calc.get(item):
+                    for d in self._extra_calc.get(item)["scale_dep"] + self._extra_calc.get(item)["bias_dep"]:
+                        # A dependency scheduled in a slower group (e.g. a "boot" scaling factor) is not read again, its value is kept
+                        if item in self._period and self._period.get(d[1], 0) > self._period[item]: continue
+                        # A dependency that is calculated too is replaced by its own dependencies (chained parameters)
+                        if d[1] != item and self._extra_calc.get(d[1]): result.extend(self.handle_dependency([d[1]]))
+                        else: result.append(d[1].lower())
+                else: result.append(item.lower())
+        return result
+
+    def handle_read_address(self,raw_address):
+        # Normalize the read address and replace self._extra_calc parameters with their dependencies
+        address = [a.lower() if isinstance(a,str) else (a + self._shift) for a in raw_address]
+        for key, value in self._extra_calc.items():
+            if key.lower() in address:
+                try: extra = self.handle_dependency(self._extra_calc[key]["compile"])
+                except KeyError: extra = self.handle_dependency([key])
+                address.extend(extra); address.remove(key.lower())
+        return address
+
+    def handle_write_address(self,address,param=None,fc=None):
+        # Match the write address with self._memory_dict, then return [name, function code, address, parameter]
+        fcw = fc
+        if not isinstance(address,str): address += self._shift
+        key = self._index.get(address.lower() if isinstance(address,str) else address)
+        if key != None:
+            value = self._memory_dict[key]
+            address = value["address"]
+            if fcw == None:
+                fcw = value["fcw"]
+                if value["fcw"] == None:
+                    print(" -- This address is read-only -- ")
+            if param == None:
+                if value.get("param") is not None:
+                    param = value["param"]
+                else:
+                    print(" -- no parameter to be written --"); return None
+            else:
+                if value.get("scale") is not None:
+                    param = param*value["scale"]
+        return [key, fcw, address, param]
+
+    def send_command(self,command,address,param=None,fc=None):
+        response = None
+        # Send the command and read response with function_code 0x03 (3) or 0x04 (4)
+        if command == "read":
+            response = self.execute(self.compile_read(address, fc))
+
+        # start writting sequence to send command with function_code 0x06 (6) or 0x10 (16)
+        elif command == "write":
+            write = self.handle_write_address(address,param,fc)
+            if write == None: return
+            key, fcw, address, param = write
+            if (fcw == None) or (param == None) or isinstance(address,str):
+                print(" -- incomplete input argument -- ")
+            else:
+                response = self.writting_sequence(fcw, address, param)
+                print("{} ({}) get: {}".format(key, str(hex(address)), response))
+
+        else: print("-- unrecognized command --")
+
+    async def async_wait(self,ready):
+        # Wait until the monotonic time 'ready' without blocking the event loop. asyncio is only imported here,
+        # it takes longer to import than the whole engine and the sync polling path never needs it
+        import asyncio
+        await asyncio.sleep(max(0, ready - time.monotonic()))
+
+    async def async_read_block(self,fc,block,retry=0):
+        # asyncio version of self.read_block(), for pymodbus' async serial client
+        response, outcome = None, None
+        if fc == 0x03 or fc == 0x04:
+            sent, error = time.monotonic(), None
+            try:
+                if fc == 0x03:
+                    response = await self._client.read_holding_registers(address=block["address"], count=block["count"], slave=self._slave)
+                else:
+                    response = await self._client.read_input_registers(address=block["address"], count=block["count"], slave=self._slave)
+            except Exception as e: error = e
+            ready, outcome = self.handle_read_response(fc, block, sent, response, error, retry)
+            await self.async_wait(ready)
+        else: print(" -- function code needs to be declared for this list of read address --")
+        return response, outcome
+
+    async def async_read_block_retry(self,fc,block):
+        # asyncio version of self.read_block_retry()
+        if block.get("pinned"):
+            response = None
+            for half in block["split"]: response = await self.async_read_block_retry(fc,half) or response
+            return response
+        response, outcome = await self.async_read_block(fc,block)
+        retry = 0
+        while outcome not in ("ok", "exception", None) and retry < self._retries and self._budget > 0 and not self._offline:
+            retry += 1; self._budget -= 1
+            await self.async_wait(time.monotonic() + self.handle_backoff(retry))
+            response, outcome = await self.async_read_block(fc,block,retry)
+        if outcome in ("exception", "crc", "error"): response = await self.async_read_block_split(fc,block,outcome) or response
+        return response
+
+    async def async_read_block_split(self,fc,block,outcome):
+        # asyncio version of self.read_block_split()
+        response = None
+        if self._budget > 0 and self.split_block(fc,block):
+            if outcome == "exception": block["pinned"] = True
+            for half in block["split"]:
+                if self._budget <= 0: break
+                self._budget -= 1
+                r, outcome = await self.async_read_block(fc,half,1)
+                if outcome in ("exception", "crc", "error"): r = await self.async_read_block_split(fc,half,outcome) or r
+                response = r or response
+        return response
+
+    async def async_execute(self,plan):
+        # asyncio version of self.execute()
+        response = None
+        self._budget = self._retry_budget
+        if self.handle_probe(plan): response, outcome = await self.async_read_block(plan["fc"],self.probe_block(plan))
+        for block in plan["blocks"]:
+            if self._offline: self.save_slots([None]*len(block["slots"]), block["slots"])
+            else: response = await self.async_read_block_retry(plan["fc"],block) or response
+        self.handle_extra_calculation()
+        return response
+
+    async def async_reading_sequence(self,fcr,address):
+        return await self.async_execute(self.plan_read(fcr,address))
+
+    async def async_writting_sequence(self,fcw,address,param):
+        # asyncio version of self.writting_sequence()
+        response = None
+        if isinstance(param, list):
+            params = []
+            for p in param: params.extend(self.handle_multiple_writting(p))
+        else: params = self.handle_multiple_writting(param)
+        # Send the command with function_code 0x06 (6) or 0x10 (16)
+        sent, error = time.monotonic(), None
+        try:
+            if fcw == 0x06:
+                response = await self._client.write_register(address=address, value=param, slave=self._slave)
+            elif fcw == 0x10:
+                response = await self._client.write_registers(address=address, values=params, slave=self._slave)
+        except Exception as e: error = e
+        ready = self.handle_write_response(fcw, address, len(params), sent, response, error)
+        if error != None: raise error
+        await self.async_wait(ready)
+        return response
+
+    async def async_send_command(self,command,address,param=None,fc=None):
+        # asyncio version of self.send_command(), the delay between commands does not block the event loop
+        response = None
+        # Send the command and read response with function_code 0x03 (3) or 0x04 (4)
+        if command == "read":
+            response = await self.async_execute(self.compile_read(address, fc))
+
+        # start writting sequence to send command with function_code 0x06 (6) or 0x10 (16)
+        elif command == "write":
+            write = self.handle_write_address(address,param,fc)
+            if write == None: return
+            key, fcw, address, param = write
+            if (fcw == None) or (param == None) or isinstance(address,str):
+                print(" -- incomplete input argument -- ")
+            else:
+                response = await self.async_writting_sequence(fcw, address, param)
+                print("{} ({}) get: {}".format(key, str(hex(address)), response))
+
+        else: print("-- unrecognized command --")
@@ -0,0 +1,146 @@
+"""
+#title           :timeseries.py
+#description     :fixed-size ring buffers of the polled signals, aggregated (min/max/mean/last, energy) over each upload window,
+#                 and persistent energy counters integrated from the power signals
+#author          :Nicholas Putra Rihandoko, Nauval Chantika
+#date            :2026/10/18
+#version         :0.1
+#usage           :Energy Monitoring System
+#notes           :fed on every poll, so the uploaded row carries window aggregates instead of point samples
+#python_version  :3.7.3
+#==============================================================================
+"""
+import os
+import json
+import time
+from array import array
+
+class ring:
+    # Ring buffer of the latest (monotonic time, value) samples of one signal in two array('d'), the oldest sample is overwritten
+    def __init__(self,size=256):
+        self._size  = size
+        self._time  = array('d', bytes(8*size))
+        self._value = array('d', bytes(8*size))
+        self._next  = 0     # index of the next sample
+        self._count = 0     # number of stored samples
+
+    def append(self,t,value):
+        # A missing value (None, e.g. a failed read) is not stored, the window only aggregates real samples
+        if value == None: return
+        self._time[self._next], self._value[self._next] = t, value
+        self._next = (self._next + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def samples(self,start,end):
+        # Get the [time, value] samples with start < time <= end in chronological order, preceded by the latest sample
+        # before start (None if there is none) so an integral over consecutive windows covers every interval once
+        before, inside = None, []
+        for i in range(self._next - self._count, self._next):
+            t, v = self._time[i % self._size], self._value[i % self._size]
+            if t <= start: before = [t, v]
+            elif t <= end: inside.append([t, v])
+        return before, inside
+
+    def aggregate(self,start,end,integral=False,gap=60):
+        # Get [min, max, mean, last] of the samples in the window (start, end], all None if there is no sample.
+        # With integral, also the trapezoidal integral in value*hour (kW -> kWh), skipping intervals longer than gap seconds
+        before, inside = self.samples(start,end)
+        if not inside: return [None]*(5 if integral else 4)
+        value = [v for t, v in inside]
+        result = [min(value), max(value), sum(value)/len(value), value[-1]]
+        if integral:
+            energy, prev = 0.0, before
+            for t, v in inside:
+                if prev != None and t - prev[0] <= gap: energy += (v + prev[1])/2 * (t - prev[0])/3600
+                prev = [t, v]
+            result.append(energy)
+        return result
+
+class series:
+    # Ring buffers of several signals: {signal: [node index, attribute name, integral]}, fed from the node objects on every poll
+    def __init__(self,signal,size=256,gap=60):
+        self._signal = signal
+        self._ring   = {s: ring(size) for s in signal}
+        self._gap    = gap
+
+    def feed(self,server,t):
+        # Sample every signal from the node objects (after a poll at the monotonic time t)
+        for s, (index, attr, integral) in self._signal.items():
+            self._ring[s].append(t, getattr(server[index], attr, None))
+
+    def title(self):
+        # Column names of the window aggregates, in the order of self.aggregate()
+        title = []
+        for s, (index, attr, integral) in self._signal.items():
+            title += [s+"_min", s+"_max", s+"_mean", s+"_last"] + ([s+"_kWh"] if integral else [])
+        return title
+
+    def aggregate(self,start,end,digits=3):
+        # Window aggregates of every signal over (start, end], rounded
+        data = []
+        for s, (index, attr, integral) in self._signal.items():
+            data += [None if v == None else round(v, digits) for v in self._ring[s].aggregate(start, end, integral, self._gap)]
+        return data
+
+class integrator:
+    # Cumulative trapezoidal energy (kWh) of power signals (kW): {signal: [node index, attribute name]}, split into the energy
+    # of positive and of negative power (e.g. consumed and produced), fed with the monotonic time of every poll.
+    # An interval longer than gap seconds (failed reads, offline node, restart) is skipped or, with policy "interpolate",
+    # integrated between its two samples. The counters are saved to a JSON file and continue after a restart
+    def __init__(self,signal,path=None,gap=60,policy="skip"):
+        self._signal = signal
+        self._path   = path
+        self._gap    = gap
+        self._policy = policy
+        self._energy = {s: [0.0, 0.0] for s in signal}  # [positive, negative] kWh
+        self._last   = {s: None for s in signal}        # last sample [monotonic time, value] of this run
+        self._saved  = {s: None for s in signal}        # last sample [wall time, value] before the restart
+        self.load()
+
+    def load(self):
+        if self._path == None: return
+        try:
+            with open(self._path, 'r') as f: saved = json.load(f)
+        except (OSError, ValueError): return
+        for s in self._signal:
+            if s in saved:
+                self._energy[s] = [float(e) for e in saved[s]["energy"]]
+                self._saved[s] = saved[s]["last"]
+
+    def save(self):
+        # Write the counters at once (tmp file then replace), a power cut never leaves half a file
+        if self._path == None: return
+        wall, mono = time.time(), time.monotonic()
+        data = {s: {"energy":self._energy[s],
+                    "last":self._saved[s] if self._last[s] == None else [wall - (mono - self._last[s][0]), self._last[s][1]]}
+                for s in self._signal}
+        try:
+            with open(self._path + ".tmp", 'w') as f: json.dump(data, f)
+            os.replace(self._path + ".tmp", self._path)
+        except OSError as e: print(" -- energy counters are not saved: {} --".format(e))
+
+    def add_interval(self,name,dt,v0,v1):
+        # Add the trapezoid of one interval (dt in seconds), split at the zero crossing if the power changes sign
+        if dt <= 0 or (dt > self._gap and self._policy != "interpolate"): return
+        if v0*v1 >= 0: part = [[(v0 + v1)/2*dt, v0 + v1]]
+        else:
+            tz = dt*abs(v0)/(abs(v0) + abs(v1))
+            part = [[v0/2*tz, v0], [v1/2*(dt - tz), v1]]
+        for e, sign in part:
+            self._energy[name][0 if sign >= 0 else 1] += abs(e)/3600
+
+    def feed(self,server,t):
+        # Integrate every signal up to its current value of the node objects (after a poll at the monotonic time t)
+        for s, (index, attr) in self._signal.items():
+            value = getattr(server[index], attr, None)
+            if value == None: continue
+            if self._last[s] != None: self.add_interval(s, t - self._last[s][0], self._last[s][1], value)
+            elif self._saved[s] != None: self.add_interval(s, time.time() - self._saved[s][0], self._saved[s][1], value)
+            self._last[s] = [t, value]
+
+    def title(self):
+        # Column names of the counters, in the order of self.get()
+        return [s + suffix for s in self._signal for suffix in ("_pos", "_neg")]
+
+    def get(self,digits=4):
+        return [round(e, digits) for s in self._signal for e in self._energy[s]]
@@ -11,34 +11,55 @@
 """
 
 # Import library
-import datetime # RTC Real Time Clock
 import time
+start_time = time.perf_counter()   # process start, for the --profile-startup report
+import datetime # RTC Real Time Clock
 import os
+import sys
+import importlib
 import socket
+import signal
 import threading
 import logging
 from pymodbus.client import ModbusSerialClient as ModbusClient
 import query
-from lib import kyuden_battery_72kWh as battery
-from lib import yaskawa_D1000 as converter
-from lib import yaskawa_GA500 as inverter
-#from lib import tristar_MPPT as charger
+from lib import modbus_metrics as metrics
+from lib import timeseries
+from lib import archive
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 # Define Modbus communication parameters
 port            = '/dev/ttyS0'    # for RS485/CAN Hat
-port_id0        = 'Prolific_Technology_Inc' # for USB-to-RS232C adaptor
-port0           = os.popen('sudo bash {}/get_usb.bash {}'.format(os.path.dirname(os.path.abspath(__file__)), port_id0)).read().strip()
+port_id0        = 'Prolific_Technology_Inc' # for USB-to-RS232C adaptor (name in /dev/serial/by-id)
 method          = 'rtu'
 bytesize        = 8
 stopbits        = 1
 parity          = 'N'
 baudrate        = 9600   # data/byte transmission speed (in bytes per second)
-client_latency  = 100   # the delay time master/client takes from receiving response to sending a new command/request (in milliseconds)
+client_latency  = 100   # the longest delay master/client takes from receiving response to sending a new command/request, the nodes learn a shorter one (in milliseconds)
 timeout         = 1   # the maximum time the master/client will wait for response from slave/server (in seconds)
+retries         = 2   # re-reads of a failed register block within the same polling cycle
+retry_budget    = 6   # the most re-sent read commands of one node in a polling cycle, a noisy bus cannot stall the loop
+offline_after   = 3   # consecutive timeouts before a node is offline (switched off), then it is only probed with one register
+probe_max       = 300 # the longest period between the probes of an offline node, starting at 5 s and doubled each probe (in seconds)
 interval        = 30   # the period between each subsequent communication routine/loop (in seconds)
+tick            = 2    # the period of the fastest polling group, the loop wakes up this often (in seconds)
+poll_period     = {"fast":tick, "normal":interval, "slow":3600, "boot":0}   # polling period of each register "period" class (in seconds, 0 = once at boot)
+storage         = 'array'   # keep read values in a compact array('d') per node instead of one attribute each (None to disable)
+use_asyncio     = False   # poll every serial port from one asyncio event loop instead of one thread per port
+cell_scan       = True   # read every battery cell voltage each loop (bulk scan, for imbalance tracking)
+profile_startup = '--profile-startup' in sys.argv   # print the time spent in each startup phase until the first poll
+metrics_file    = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'save', 'modbus_metrics.json')  # latency/error metrics of every node, dumped each interval (None to disable)
+metrics_socket  = '/tmp/modbus_metrics_socket'   # the same metrics are sent to every connection on this unix socket (None to disable)
+
+# Define the Modbus slave/server (nodes): [device library in lib/, name, serial port, slave address]
+# Only the libraries of these nodes are imported, the order is the order of server[] in data_processing()
+node_config     = [["yaskawa_D1000", "CONVERTER", port, 2],
+                   ["kyuden_battery_72kWh", "BATTERY", port_id0, 1],
+                   ["yaskawa_GA500", "INVERTER", port, 3]]
+                   #["tristar_MPPT", "SOLAR CHARGER", port, 4]]
 
 # Define MySQL Database parameters
 mysql_server    = {"host":"machinedatanglobal.c4sty2dpq6yv.ap-northeast-1.rds.amazonaws.com",
@@ -55,42 +76,160 @@ mysql_server    = {"host":"machinedatanglobal.c4sty2dpq6yv.ap-northeast-1.rds.am
 #                    "port":3306}
 mysql_timeout   = 3 # the maximum time this device will wait for completing MySQl query (in seconds)
 mysql_interval  = 60 # the period between each subsequent update to database (in seconds)
+upload          = query.uploader(mysql_server, 'modbus_log.csv', mysql_timeout, size=64)   # background upload worker, fed by update_database()
+
+# Define report-by-exception parameters, a row is only logged/uploaded and sent to the display if a signal moved beyond its deadband
+# since the last reported row or after the heartbeat. Deadband of each signal: [absolute, percent of the last reported value] (None = unused)
+deadband        = {"cpu_Temp":[5,None], "bat_Temp":[1,None], "bat_soc":[1,None], "bat_ttl_V":[None,1], "bat_avg_V":[0.01,None],
+                   "con_out_V_ref":[1,None], "con_in_V":[None,2], "con_in_A":[0.5,5], "con_out_kW":[0.2,5], "con_in_Hz":[0.1,None],
+                   "con_in_PF":[0.02,None], "con_in_kW":[0.2,5], "con_consume_kWh":[1,None], "con_produce_kWh":[1,None],
+                   "inv_out_Hz":[0.5,None], "inv_out_A":[0.5,5], "inv_out_V_ref":[1,None], "inv_out_kWh":[1,None]}
+heartbeat       = 900 # the longest period without a reported row, even if nothing changed (in seconds)
+report_db       = query.deadband(deadband, heartbeat)       # report-by-exception of the database and CSV log
+report_display  = query.deadband(deadband, heartbeat)       # report-by-exception of the display socket
+
+# Define the signals sampled into a ring buffer on every poll (tick): {column: [server index, attribute, integrate kW into kWh]}
+# Their min/max/mean/last (and kWh) since the last database row are added at the end of the row (with extended_row)
+sample_signal   = {"con_out_kW":[0,"DC_Power",True], "con_in_kW":[0,"AC_Power",True], "con_in_A":[0,"AC_Current",False],
+                   "inv_out_A":[2,"Output_Current",False], "inv_out_kW":[2,"AC_Power",True]}
+samples         = timeseries.series(sample_signal, size=(heartbeat+mysql_interval)//tick+16, gap=10*tick)   # holds the longest window (heartbeat, checked every mysql_interval)
+
+# Define the power signals (kW) integrated into energy counters (kWh of positive and negative power) on every poll: {column: [server index, attribute]}
+# An interval longer than 10 ticks (failed reads, restart) is skipped ("skip") or integrated between its samples ("interpolate")
+energy_signal   = {"con_dc_kWh":[0,"DC_Power"], "con_ac_kWh":[0,"AC_Power"], "inv_ac_kWh":[2,"AC_Power"]}
+energy          = timeseries.integrator(energy_signal, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'save', 'energy_counter.json'),
+                                        gap=10*tick, policy="skip")
+# Add the window aggregates and the energy counters at the end of the database row. Off by default, the MySQL table only has the
+# 19 columns of data_processing() until their columns are added (ALTER TABLE ... ADD COLUMN <name> DOUBLE NULL for each name)
+extended_row    = False
+
+# Define the signals kept on every poll in the long-term columnar archive (save/modbus_archive/YYYY-MM-DD.arc): {column: [server index, attribute]}
+# Every column is stored as a fixed-point integer with the digits of its register's round, in compressed blocks of 900 polls
+# (the polls of the block being filled are kept in save/modbus_archive/staging until then)
+archive_signal  = {"bat_Temp":[1,"Temperature_avg"], "bat_soc":[1,"SOC"], "bat_ttl_V":[1,"Total_Voltage"], "bat_avg_V":[1,"Cell_Voltage_avg"],
+                   "con_out_V_ref":[0,"DC_Voltage_Command"], "con_in_V":[0,"AC_Voltage"], "con_in_A":[0,"AC_Current"], "con_out_kW":[0,"DC_Power"],
+                   "con_in_Hz":[0,"AC_Frequency"], "con_in_PF":[0,"Power_Factor"], "con_in_kW":[0,"AC_Power"], "con_consume_kWh":[0,"Consumed_Power_kWh"],
+                   "con_produce_kWh":[0,"Produced_Power_kWh"], "inv_out_Hz":[2,"Output_Frequency"], "inv_out_A":[2,"Output_Current"],
+                   "inv_out_V_ref":[2,"Output_Voltage"], "inv_out_kWh":[2,"AC_Power"]}
+history         = archive.writer(archive_signal, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'save', 'modbus_archive'),
+                                 block=900, codec="zlib")   # codec "lzma" is smaller but slower
 
 # Another Constants
 SYNC_WAIT_TIME = 5  # Time (in seconds) to wait before actual data transfer.
 
 #query.debugging()  # Monitor Modbus communication for debugging
 
-def setup_modbus():
-    global port, port0, method, bytesize, stopbits, parity, baudrate, client_latency, timeout
+def mark_startup(phase):
+    # Record the end of a startup phase for the --profile-startup report
+    if profile_startup: startup_phase.append([phase, time.perf_counter()])
+startup_phase = []
+
+def report_startup():
+    # Print the time spent in each startup phase (once, after the first poll)
+    global profile_startup
+    if not profile_startup: return
+    profile_startup = False
+    print("<===== startup profile =====>")
+    last = start_time
+    for phase, t in startup_phase:
+        print("{:<20}: {:8.1f} ms".format(phase, (t - last)*1000)); last = t
+    print("{:<20}: {:8.1f} ms".format("total", (last - start_time)*1000))
+    print("")
+
+def find_serial_port(port_id):
+    # Find the device (e.g. /dev/ttyUSB0) of a USB serial adaptor from its name in /dev/serial/by-id, a device path is used as is
+    if os.path.exists(port_id): path = port_id
+    else:
+        path = port_id
+        try:
+            for name in os.listdir('/dev/serial/by-id'):
+                if port_id in name: path = os.path.realpath(os.path.join('/dev/serial/by-id', name)); break
+        except FileNotFoundError: pass
+    # Grant the read/write permission only when it is missing (the user is usually in the dialout group)
+    if os.path.exists(path) and not os.access(path, os.R_OK | os.W_OK):
+        os.system('sudo chmod a+rw {}'.format(path))
+    return path
+
+def setup_modbus(client_type=ModbusClient):
+    global node_config, method, bytesize, stopbits, parity, baudrate, client_latency, timeout, storage, retries, retry_budget, offline_after, probe_max
+    # Import the library of every configured device
+    device = {d[0]: importlib.import_module("lib." + d[0]) for d in node_config}
+    mark_startup("device libraries")
     # Set each Modbus communication port specification
-    client = ModbusClient(port=port, method=method, stopbits=stopbits, bytesize=bytesize, parity=parity, baudrate=baudrate, timeout=timeout)
-    client0 = ModbusClient(port=port0, method=method, stopbits=stopbits, bytesize=bytesize, parity=parity, baudrate=baudrate, timeout=timeout)
-    # Connect to the Modbus serial
-    client.connect()
-    client0.connect()
+    client = {}
+    for d in node_config:
+        if d[2] not in client:
+            client[d[2]] = client_type(port=find_serial_port(d[2]), method=method, stopbits=stopbits, bytesize=bytesize, parity=parity, baudrate=baudrate, timeout=timeout)
+            # Connect to the Modbus serial (async clients are connected inside the event loop by async_main)
+            if client_type == ModbusClient: client[d[2]].connect()
+    mark_startup("serial ports")
     # Define the Modbus slave/server (nodes) objects
-    bat = battery.node(slave=1, name='BATTERY', client=client0, delay=client_latency, max_count=20, increment=1, shift=0)
-    conv = converter.node(slave=2, name='CONVERTER', client=client, delay=client_latency, max_count=20, increment=1, shift=0)
-    inv = inverter.node(slave=3, name='INVERTER', client=client, delay=client_latency, max_count=20, increment=1, shift=0)
-    #chr = charger.node(slave=4, name='SOLAR CHARGER', client=client, delay=client_latency)
-    server = [conv, bat, inv]
+    server = []
+    for d in node_config:
+        server.append(device[d[0]].node(slave=d[3], name=d[1], client=client[d[2]], delay=client_latency, max_count=20, increment=1, shift=0, baudrate=baudrate, storage=storage,
+                                        retries=retries, retry_budget=retry_budget, offline_after=offline_after, probe_max=probe_max))
+    mark_startup("nodes")
     return server
 
-def read_modbus(server):
+def compile_modbus(server):
     addr=[["DC_Voltage_Command","AC_Voltage","AC_Current","DC_Power","AC_Frequency","Power_Factor","AC_Power","Consumed_Power_kWh","Produced_Power_kWh"],
-          ["SOC","Total_Voltage","Cell_Voltage_avg","Temperature_avg"],
+          ["SOC","Total_Voltage","Cell_Voltage_avg","Temperature_avg","Count_Module"],
           ["Output_Frequency","Output_Current","Output_Voltage","AC_Power"]]
-    
+    # Build each node's polling schedule once, the polling loop only executes the plans that are due
+    plan = []
+    for i in range(len(server)):
+        plan.append(server[i].compile_schedule(addr[i], poll_period))
+    return plan
+
+def read_bus(server, plan, now, normal=True):
+    # Nodes sharing one serial port are polled one after another
     for i in range(len(server)):
         try:
-            server[i].send_command(command="read",address=addr[i])
+            due = server[i].due_plan(plan[i], now)
+            if due != None: server[i].execute(due)
+            if normal and cell_scan and hasattr(server[i], "scan_cells"): server[i].scan_cells()
         except Exception as e:
             # Print the error message
             print("(modbus) problem with",server[i]._name,":")
             print(e)
             print("<===== ===== continuing ===== =====>")
             print("")
+
+def group_bus(server):
+    # Group the node index by their serial port (Modbus client)
+    bus = {}
+    for i in range(len(server)):
+        bus.setdefault(id(server[i]._client), []).append(i)
+    return list(bus.values())
+
+def read_modbus(server, plan, now, normal=True):
+    # Poll every serial port on its own thread
+    timer = datetime.datetime.now()
+    threads = [threading.Thread(target=read_bus, args=([server[i] for i in index], [plan[i] for i in index], now, normal)) for index in group_bus(server)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    # Every port starts at the same time, so the merged readings share this timestamp
+    return timer
+
+async def async_read_bus(server, plan, now, normal=True):
+    # asyncio version of read_bus()
+    for i in range(len(server)):
+        try:
+            due = server[i].due_plan(plan[i], now)
+            if due != None: await server[i].async_execute(due)
+            if normal and cell_scan and hasattr(server[i], "async_scan_cells"): await server[i].async_scan_cells()
+        except Exception as e:
+            # Print the error message
+            print("(modbus) problem with",server[i]._name,":")
+            print(e)
+            print("<===== ===== continuing ===== =====>")
+            print("")
+
+async def async_read_modbus(server, plan, now, normal=True):
+    # Poll every serial port as its own task of the event loop
+    timer = datetime.datetime.now()
+    await asyncio.gather(*[async_read_bus([server[i] for i in index], [plan[i] for i in index], now, normal) for index in group_bus(server)])
+    return timer
             
 def write_modbus(server):
     #return
@@ -164,6 +303,23 @@ def send_data_socket(raw_data):
         print(f"(socket) General Error in send_data_socket: {e}")
         return None
         
+async def async_send_data_socket(raw_data):
+    # asyncio version of send_data_socket()
+    try:
+        data_str = ','.join(map(str,raw_data))
+        reader, writer = await asyncio.open_unix_connection('/tmp/ipc_socket')
+        print(data_str)
+        writer.write(data_str.encode('utf-8'))
+        await writer.drain()
+        # Receive acknowledgment from server
+        ack = (await reader.read(1024)).decode('utf-8')
+        print("(socket) Received from server:", ack)
+        writer.close()
+        return ack
+    except Exception as e:
+        print(f"(socket) General Error in async_send_data_socket: {e}")
+        return None
+
 def data_processing(server, timer):
     cpu_temp = query.get_cpu_temperature()
     
@@ -183,26 +339,34 @@ def data_processing(server, timer):
     
     return title, data
 
+def extend_row(title, data, window, now):
+    # Database row: the data row, with extended_row also the aggregates of the sampled window (since window) and the energy counters
+    if not extended_row: return title, data
+    return title + samples.title() + energy.title(), data + samples.aggregate(window, now) + energy.get()
+
 def update_database(title, data, timer):
     global mysql_server
     # Define MySQL queries and data which will be used in the program
-    cpu_temp = query.get_cpu_temperature()
     mysql_query = ("INSERT INTO `{}` ({}) VALUES ({})".format(mysql_server["table"],
                                                                 ",".join(title),
                                                                 ",".join(['%s' for _ in range(len(title))])))
-    filename = 'modbus_log.csv'
 
-    query.log_in_csv(title ,data, timer, filename)
-    query.retry_mysql(mysql_server, mysql_query, filename, mysql_timeout)
+    # Queue the row for the background upload worker (CSV journal then MySQL), a slow uplink never delays the polling loop
+    upload.submit(mysql_query, title, data, timer)
 
 #################################################################################################################
 def main():
+    mark_startup("import")
+    if metrics_socket: metrics.serve(metrics_socket)
+    metrics.gauge["upload"] = upload.status
     init = True  # variable to check Modbus initialization
     # Checking the connection Modbus
     while init:
         try:
             # Setup Raspberry Pi as Modbus client/master
             server = setup_modbus()
+            plan = compile_modbus(server)
+            mark_startup("read plans")
             logging.info("Connected to Modbus Communication")
             #print("<===== Connected to Modbus Communication =====>")
             #print("")
@@ -223,29 +387,48 @@ def main():
                 first[0] = False
                 # time counter
                 start = datetime.datetime.now()
+                report = time.monotonic()
+                window = 0  # start of the sampled window of the next database row
                 write_modbus(server)
             
-            # Send the command to read the measured value and do all other things
-            read_modbus(server)
-            timer = datetime.datetime.now()
-            query.print_response(server, timer)
-            title, data = data_processing(server, timer)
-        
-            #Send data to other script for display purpose
-            acknowledgment = threading.Thread(target=send_data_socket, args=(data,)).start()
-
-            # Check elapsed time
-            if (timer - start).total_seconds() > mysql_interval or first[1] == True:
-                start = timer
-                first[1] = False
-                # Update/push data to database
-                update_database(title, data, timer)
-        
-            if acknowledgment == 'ack':
-                print("(socket) Data successfully received by the server!")
-            else:
-                print("(socket) There was an issue sending the data or acknowledgment was not received.")
-            time.sleep(interval)
+            # Send the command to read the measured value (only the register groups that are due at this tick)
+            now = time.monotonic()
+            normal = now >= report
+            timer = read_modbus(server, plan, now, normal)
+            samples.feed(server, now)
+            energy.feed(server, now)
+            history.feed(server, timer)
+            if first[1]: mark_startup("first poll"); report_startup()
+
+            # Do all other things once every interval
+            if normal:
+                report = max(report + interval, now)
+                query.print_response(server, timer)
+                if metrics_file: metrics.dump(metrics_file)
+                energy.save()
+                title, data = data_processing(server, timer)
+            
+                #Send data to other script for display purpose (only if a signal changed)
+                display = report_display.check(title, data)
+                if display: acknowledgment = threading.Thread(target=send_data_socket, args=(data,)).start()
+
+                # Check elapsed time
+                if (timer - start).total_seconds() > mysql_interval or first[1] == True:
+                    start = timer
+                    first[1] = False
+                    # Update/push data to database (only if a signal changed) with the aggregates of the sampled window
+                    row_title, row_data = extend_row(title, data, window, now)
+                    if report_db.check(row_title, row_data):
+                        update_database(row_title, row_data, timer)
+                        window = now
+            
+                if not display: pass
+                elif acknowledgment == 'ack':
+                    print("(socket) Data successfully received by the server!")
+                else:
+                    print("(socket) There was an issue sending the data or acknowledgment was not received.")
+            # Wait for the next tick
+            time.sleep(max(0, now + tick - time.monotonic()))
     
         except Exception as e:
             # Print the error message
@@ -255,9 +438,92 @@ def main():
             #print("")
             time.sleep(3)
             
+async def async_main():
+    # asyncio version of main(), every serial port and the display socket share one event loop
+    mark_startup("import")
+    if metrics_socket: metrics.serve(metrics_socket)
+    metrics.gauge["upload"] = upload.status
+    init = True  # variable to check Modbus initialization
+    while init:
+        try:
+            # Setup Raspberry Pi as Modbus client/master
+            server = setup_modbus(AsyncModbusClient)
+            for index in group_bus(server):
+                await server[index[0]]._client.connect()
+            plan = compile_modbus(server)
+            mark_startup("read plans")
+            logging.info("Connected to Modbus Communication")
+            init = False
+        except Exception as e:
+            # Print the error message
+            logging.error("(modbus) Problem with Modbus communication: %s", e)
+            await asyncio.sleep(3)
+
+    first = [True, True]
+    # Reading a Modbus message and Upload to database sequence
+    while not init:
+        try:
+            # First run (start-up) sequence
+            if first[0]:
+                first[0] = False
+                # time counter
+                start = datetime.datetime.now()
+                report = time.monotonic()
+                window = 0  # start of the sampled window of the next database row
+
+            # Send the command to read the measured value (only the register groups that are due at this tick)
+            now = time.monotonic()
+            normal = now >= report
+            timer = await async_read_modbus(server, plan, now, normal)
+            samples.feed(server, now)
+            energy.feed(server, now)
+            history.feed(server, timer)
+            if first[1]: mark_startup("first poll"); report_startup()
+
+            # Do all other things once every interval
+            if normal:
+                report = max(report + interval, now)
+                query.print_response(server, timer)
+                if metrics_file: metrics.dump(metrics_file)
+                energy.save()
+                title, data = data_processing(server, timer)
+
+                #Send data to other script for display purpose
+                if report_display.check(title, data): asyncio.ensure_future(async_send_data_socket(data))
+
+                # Check elapsed time
+                if (timer - start).total_seconds() > mysql_interval or first[1] == True:
+                    start = timer
+                    first[1] = False
+                    # Update/push data to database (only if a signal changed)
+                    row_title, row_data = extend_row(title, data, window, now)
+                    if report_db.check(row_title, row_data):
+                        update_database(row_title, row_data, timer)
+                        window = now
+            # Wait for the next tick
+            await asyncio.sleep(max(0, now + tick - time.monotonic()))
+
+        except Exception as e:
+            # Print the error message
+            logging.error("Encountered an error: %s", e)
+            await asyncio.sleep(3)
+
+def handle_sigterm(signum, frame):
+    # systemd (or a watchdog) stops the service with SIGTERM, take the same shutdown path as Ctrl+C
+    raise KeyboardInterrupt
+
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, handle_sigterm)
     try:
-        main()
+        if use_asyncio:
+            # The event loop and the async client are only imported when they are used
+            import asyncio
+            from pymodbus.client import AsyncModbusSerialClient as AsyncModbusClient
+            asyncio.run(async_main())
+        else: main()
     except KeyboardInterrupt:
         logging.info("Shutting down client.")
         # Ensure resources are closed properly.
+        energy.save()
+        history.flush()
+        upload.close()
@@ -26,7 +26,7 @@ bytesize        = 8
 stopbits        = 1
 parity          = 'E'
 baudrate        = 19200   # data/byte transmission speed (in bytes per second)
-client_latency  = 300   # the delay time master/client takes from receiving response to sending a new command/request (in milliseconds)
+client_latency  = 300   # the longest delay master/client takes from receiving response to sending a new command/request, the nodes learn a shorter one (in milliseconds)
 timeout         = 20/1000   # the maximum time the master/client will wait for response from slave/server (in seconds)
 interval        = 30   # the period between each subsequent communication routine/loop (in seconds)
 
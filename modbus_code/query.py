@@ -11,11 +11,15 @@
 """
 
 import logging
-import pymysql
-import signal
 import datetime
+import time
 import csv
+import json
 import os
+import shutil
+import queue
+import threading
+from array import array
 
 #################################################################################################################
 # General function for debugging
@@ -26,10 +30,6 @@ def debugging():
     log = logging.getLogger()
     log.setLevel(logging.DEBUG)
 
-def handle_timeout(signum, frame):
-    raise TimeoutError("Execution timed out")
-signal.signal(signal.SIGALRM, handle_timeout)
-
 def get_cpu_temperature():
     # Read CPU temperature from file
     with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
@@ -44,105 +44,208 @@ def print_response(server,timer):
         print(server[i]._name, "MEASUREMENTS")
         print("Time             :", timer.strftime("%d/%m/%Y-%H:%M:%S"))
         print("CPU Temperature  :", cpu_temp, "degC")
-        for attr_name, attr_value in vars(server[i]).items():
+        for attr_name, attr_value in server[i].get_read_attr().items():
             if not attr_name.startswith("_"):
                 if not isinstance(attr_value, list):
                     print(attr_name, "=", attr_value)
                 else:
                     #continue
-                    if not isinstance(attr_value[0], list):
+                    if not isinstance(attr_value[0], (list, array)):
                         print(attr_name, "=", attr_value)
                     else:
                         for i in range(len(attr_value)):
                             print(attr_name, i+1, "=", attr_value[i])
         print("")
 
+#################################################################################################################
+## Report-by-exception of a data row
+
+class deadband:
+    # A data row is only reported when a signal moved beyond its deadband since the last reported row, or when nothing
+    # was reported for 'heartbeat' seconds. threshold = {title: [absolute, percent of the last reported value]},
+    # the larger of both is the deadband (None = unused). Signals without a threshold never trigger a report
+    def __init__(self, threshold, heartbeat=900):
+        self._threshold = threshold
+        self._heartbeat = heartbeat
+        self._last = None       # last reported row {title: value}
+        self._last_time = None  # monotonic time of the last reported row
+
+    def is_changed(self, title, value):
+        last = self._last[title]
+        if value == last: return False
+        # Appearing or missing values (e.g. an offline node) and non numerical values are always a change
+        if not isinstance(value, (int, float)) or not isinstance(last, (int, float)): return True
+        absolute, percent = self._threshold[title]
+        return abs(value - last) > max(absolute or 0, abs(last)*(percent or 0)/100)
+
+    def check(self, title, data):
+        # True if the row should be reported (the first row always is), then it becomes the reference of the next rows
+        now = time.monotonic()
+        report = self._last == None or now - self._last_time >= self._heartbeat
+        if not report:
+            report = any(self.is_changed(t, d) for t, d in zip(title, data) if t in self._threshold)
+        if report: self._last, self._last_time = dict(zip(title, data)), now
+        return report
+
 #################################################################################################################
 ## Handle saving data to CSV
 
 # Define the directory of the backup file and the data to be logged
+# Each log is an append-only journal of daily CSV segments: save/<log name>/<YYYY-MM-DD>.csv (each with its header),
+# a segment expires as a whole after log_limit days. save/<log name>/cursor marks the first row not uploaded to MySQL yet
 log_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'save')
 log_limit = 31
+log_fsync = False   # flush every row to the SD card at once (safer on power cuts, but more flash wear)
+log_expired = {}    # {journal directory: date of the last expiry check}
 
 def strval(array):
     # Change an array into a string (used to save array value into MySQL database or CSV)
     string = " ".join(map(str, array))
     return string
 
+def get_journal(filename):
+    # Get the journal directory of a log (e.g. 'modbus_log.csv' -> save/modbus_log/), a log file of the older
+    # single file format only holds rows not uploaded yet, it is moved into the journal as the segment of its last write
+    directory = os.path.join(log_directory, os.path.splitext(filename)[0])
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+        legacy = os.path.join(log_directory, filename)
+        if os.path.exists(legacy):
+            date = datetime.date.fromtimestamp(os.path.getmtime(legacy)).strftime('%Y-%m-%d')
+            os.replace(legacy, os.path.join(directory, date + '.csv'))
+    return directory
+
+def get_segments(directory):
+    # Daily segments of a journal, oldest first
+    return sorted(f for f in os.listdir(directory) if f.endswith('.csv'))
+
+def expire_segments(directory, timer):
+    # Remove the segments older than log_limit days, checked once a day
+    if log_expired.get(directory) == timer.date(): return
+    log_expired[directory] = timer.date()
+    oldest = (timer - datetime.timedelta(days=log_limit)).strftime('%Y-%m-%d')
+    for segment in get_segments(directory):
+        if segment[:10] < oldest: os.remove(os.path.join(directory, segment))
+
 def log_in_csv(title,data,timer,filename):
-    global log_directory, log_limit
     #return
-    file_directory = os.path.join(log_directory,filename)
-    file_exists = True
-    file_empty = True
-    expired_rows_to_delete = None
-    # Check if the file already exist or not
-    try:
-        with open(file_directory, 'r') as file:
-            file_empty = not file.read(1)
-            csv_log = list(csv.reader(file))
-        # Read the line in the CSV file
-        for row, row_data in enumerate(csv_log):
-            if row > 0:
-                csv_date = row_data[0]
-                is_valid_date = True
-                try: datetime.datetime.strptime(csv_date, '%Y-%m-%d %H:%M:%S')
-                except ValueError: is_valid_date = False
-                if is_valid_date:
-                    # Calculate the difference in days
-                    log_date = datetime.datetime.strptime(csv_date, '%Y-%m-%d %H:%M:%S')
-                    # Calculate how long has the data been logged
-                    timediff = (timer - log_date).days
-                    if timediff > log_limit: expired_rows_to_delete.append(row)
-                    else: break
-    except FileNotFoundError: file_exists = False
-    # Remove the expired row then write the updated contents to a new CSV file
-    if expired_rows_to_delete:
-        csv_log = [row_data for row, row_data in enumerate(csv_log) if row not in expired_rows_to_delete]
-        with open(file_directory, 'w') as file:
-            writer = csv.writer(file)
-            writer.writerows(csv_log)
-    # Add new data into csv file ()
-    with open(file_directory, mode='a' if file_exists else 'w', newline='') as file:
+    directory = get_journal(filename)
+    segment = os.path.join(directory, timer.strftime('%Y-%m-%d') + '.csv')
+    new_segment = not os.path.exists(segment)
+    # Append the row to the segment of the day, a new segment starts with the title
+    with open(segment, mode='a', newline='') as file:
         line = csv.writer(file, delimiter =',')
-        if file_empty: line.writerow(title)
+        if new_segment: line.writerow(title)
         data = [strval(d) if isinstance(d,list) else d for d in data]
         line.writerow(data)
+        if log_fsync:
+            file.flush()
+            os.fsync(file.fileno())
+    if new_segment: expire_segments(directory, timer)
+
+def read_cursor(directory):
+    # Get the upload cursor of a journal: [segment, byte offset of the first row not uploaded yet] (the first segment if none)
+    try:
+        with open(os.path.join(directory, 'cursor'), 'r') as file:
+            segment, offset = file.read().split()
+        return [segment, int(offset)]
+    except (OSError, ValueError): return ['', 0]
+
+def save_cursor(directory, cursor):
+    with open(os.path.join(directory, 'cursor.tmp'), 'w') as file:
+        file.write("{} {}".format(*cursor))
+    os.replace(os.path.join(directory, 'cursor.tmp'), os.path.join(directory, 'cursor'))
+
+def export_csv(filename, destination):
+    # Export a journal into one CSV file (the title of the first segment, then every row)
+    directory = get_journal(filename)
+    with open(destination, 'wb') as output:
+        for i, segment in enumerate(get_segments(directory)):
+            with open(os.path.join(directory, segment), 'rb') as file:
+                if i > 0: file.readline()
+                shutil.copyfileobj(file, output)
 
 #################################################################################################################
 ## Interacting with MySQL Database
 
-def connect_mysql(mysql_server,mysql_query,data=None,timeout=2):
+# One persistent connection to every MySQL server ({(host, port, db, user): connection}), so uploads skip the TCP/TLS handshake
+mysql_connection = {}
+upload_batch = 500          # the most rows uploaded in one transaction (executemany)
+upload_bytes = 256*1024     # the most CSV bytes uploaded in one transaction
+mysql_error = {}            # {thread id: the error of its last failed query}
+upload_row_time = 0.02      # in seconds, time added to the upload timeout for every row of a batch (a slow cellular uplink)
+
+class deadline:
+    # Time limit of one MySQL operation, shared by all of its steps (connect, query, commit) and cancellable from another thread.
+    # It only works through the socket timeouts of the connection, so it is safe in any thread (no SIGALRM)
+    def __init__(self, timeout=2):
+        self._end       = time.monotonic() + timeout
+        self._cancelled = False
+
+    def cancel(self):
+        # The next step of the operation fails at once (e.g. at shutdown), a step in progress stops at its socket timeout
+        self._cancelled = True
+
+    def remaining(self):
+        # Seconds left for the next step, TimeoutError if the deadline is over or cancelled
+        left = self._end - time.monotonic()
+        if self._cancelled: raise TimeoutError("MySQL operation cancelled")
+        if left <= 0: raise TimeoutError("Execution timed out")
+        return left
+
+def handle_mysql_timeout(db,limit):
+    # Bound the socket connect/read/write timeouts of the connection by the time left, PyMySQL applies them on every socket operation
+    db.connect_timeout = db._read_timeout = db._write_timeout = limit.remaining()
+
+def get_mysql(mysql_server,limit):
+    # Get the open connection to a MySQL server, reconnected if the server dropped it (e.g. after an idle timeout or an outage)
+    key = (mysql_server["host"], mysql_server["port"], mysql_server["db"], mysql_server["user"])
+    db = mysql_connection.get(key)
+    if db != None:
+        handle_mysql_timeout(db,limit)
+        db.ping(reconnect=True)
+        return db
+    # Import PyMySQL only when the first upload is due (it is the slowest import at startup)
+    import pymysql
+    # Setup Raspberry Pi as MySQl Database client
+    timeout = limit.remaining()
+    db = pymysql.connect(host=mysql_server["host"], user=mysql_server["user"], password=mysql_server["password"], db=mysql_server["db"], port=mysql_server["port"],
+                         connect_timeout=timeout, read_timeout=timeout, write_timeout=timeout)
+    mysql_connection[key] = db
+    return db
+
+def close_mysql(mysql_server):
+    # Drop the connection to a MySQL server after an error, the next query connects again
+    db = mysql_connection.pop((mysql_server["host"], mysql_server["port"], mysql_server["db"], mysql_server["user"]), None)
+    if db != None:
+        try: db.close()
+        except Exception: pass
+
+def connect_mysql(mysql_server,mysql_query,data=None,timeout=2,many=False,limit=None):
     #return
-    # Set the signal handler for the timeout
-    signal.alarm(timeout)  # Start the timeout countdown
+    # The whole operation gets timeout seconds (or the given deadline object), every step only gets the time left
+    if limit == None: limit = deadline(timeout)
     try:
-        # Setup Raspberry Pi as MySQl Database client
-        with pymysql.connect(host=mysql_server["host"], user=mysql_server["user"], password=mysql_server["password"], db=mysql_server["db"], port=mysql_server["port"]) as db:
-            # Write data in database
+        db = get_mysql(mysql_server,limit)
+        with db.cursor() as cursor:
+            # Write data in database, one row or (with many) a list of rows in one transaction
+            handle_mysql_timeout(db,limit)
             if data:
-                data = [strval(d) if isinstance(d,list) else d for d in data]
-                db.cursor().execute(mysql_query,data)
+                if many: cursor.executemany(mysql_query,[[strval(d) if isinstance(d,list) else d for d in row] for row in data])
+                else: cursor.execute(mysql_query,[strval(d) if isinstance(d,list) else d for d in data])
+                handle_mysql_timeout(db,limit)
                 db.commit()
                 val = True
-                print("<===== Data is sent to database =====>")
+                print("<===== Data is sent to database{} =====>".format(" ({} rows)".format(len(data)) if many else ""))
                 print("")
             else:
-                with db.cursor() as read:
-                    read.execute(mysql_query)
-                    val = read.fetchall()
-        # Reset the alarm as the query completed successfully
-        signal.alarm(0)
+                cursor.execute(mysql_query)
+                val = cursor.fetchall()
         return val
-    except TimeoutError as e:
-        # Handle the timeout error
-        print("problem with MySQL Server:")
-        print(e)
-        print("<===== ===== continuing ===== =====>")
-        print("")
-        return False
     except Exception as e:
-        # Print the error message
+        # Handle the timeout error and print the error message (kept in mysql_error for the caller)
+        mysql_error[threading.get_ident()] = e
+        close_mysql(mysql_server)
         print("problem with MySQL Server:")
         print(e)
         print("<===== ===== continuing ===== =====>")
@@ -150,28 +253,69 @@ def connect_mysql(mysql_server,mysql_query,data=None,timeout=2):
         return False
 
 def retry_mysql(mysql_server,mysql_query,filename,timeout=2):
-    global log_directory
     #return
-    file_directory = os.path.join(log_directory,filename)
-    rows_to_delete = []
-    # Check if the file already exist or not
-    try:
-        with open(file_directory, 'r') as file:
-            csv_log = list(csv.reader(file))
-        # Read the line in the CSV file
-        for row, row_data in enumerate(csv_log):
-            if row > 0:
-                # Retry uploading the data to mysql
-                upload_succeed = connect_mysql(mysql_server,mysql_query,row_data,timeout)
-                if upload_succeed: rows_to_delete.append(row)
-                else: break
-    except FileNotFoundError: pass
-    # Write the updated contents to a new CSV file
-    if rows_to_delete:
-        csv_log = [row_data for row, row_data in enumerate(csv_log) if row not in rows_to_delete]
-        with open(file_directory, 'w') as file:
-            writer = csv.writer(file)
-            writer.writerows(csv_log)
+    directory = get_journal(filename)
+    cursor = read_cursor(directory)
+    uploaded = 0
+    # Upload the rows after the cursor in order, in transactions of up to upload_batch rows and upload_bytes bytes.
+    # The cursor moves after every uploaded transaction and the upload stops at the first failure (get the uploaded rows)
+    for segment in get_segments(directory):
+        if segment < cursor[0]: continue
+        if segment > cursor[0]: cursor = [segment, 0]
+        with open(os.path.join(directory, segment), 'rb') as file:
+            if cursor[1] == 0: file.readline()  # the title
+            else: file.seek(cursor[1])
+            while True:
+                rows, size, end = [], 0, file.tell()
+                for line in iter(file.readline, b''):
+                    if not line.endswith(b'\n'): break   # a row still being written
+                    rows.append(next(csv.reader([line.decode('utf-8')])))
+                    size, end = size + len(line), file.tell()
+                    if len(rows) >= upload_batch or size >= upload_bytes: break
+                if not rows: break
+                if not connect_mysql(mysql_server,mysql_query,rows,timeout,many=True): return uploaded
+                cursor = [segment, end]
+                save_cursor(directory, cursor)
+                uploaded += len(rows)
+    return uploaded
+
+def read_backlog(filename):
+    # Get the journal rows not uploaded yet (after the cursor) as [title of their segment, row] and move the cursor
+    # to the end of the journal. The segments of an older program version may have other columns than the current row
+    directory = get_journal(filename)
+    cursor, rows = read_cursor(directory), []
+    for segment in get_segments(directory):
+        if segment < cursor[0]: continue
+        with open(os.path.join(directory, segment), 'rb') as file:
+            title = next(csv.reader([file.readline().decode('utf-8')]), [])
+            if segment == cursor[0] and cursor[1] > 0: file.seek(cursor[1])
+            for line in iter(file.readline, b''):
+                if not line.endswith(b'\n'): break
+                rows.append([title, next(csv.reader([line.decode('utf-8')]))])
+                cursor = [segment, file.tell()]
+    if rows: save_cursor(directory, cursor)
+    return rows
+
+def insert_query(table,title):
+    # INSERT query of a row with the columns title
+    return "INSERT INTO `{}` ({}) VALUES ({})".format(table, ",".join(title), ",".join(['%s' for _ in range(len(title))]))
+
+# MySQL server errors of a query or rows that do not fit the table (unknown column, column count, no table, no default value,
+# incorrect value, data too long, out of range), they fail the same way on every retry
+mysql_permanent = [1054, 1136, 1146, 1364, 1366, 1406, 1264]
+
+def is_permanent(error):
+    # Check if an error of a MySQL query is permanent (the query or the rows are wrong) instead of a timeout or a lost connection,
+    # without importing PyMySQL. PyMySQL raises most server errors (e.g. unknown column) as OperationalError with the error code
+    if isinstance(error, (TypeError, ValueError)): return True
+    name = type(error).__name__
+    if name in ("ProgrammingError", "DataError", "IntegrityError", "NotSupportedError"): return True
+    return name == "OperationalError" and len(error.args) > 0 and error.args[0] in mysql_permanent
+
+def is_timeout(error):
+    # Check if a MySQL query failed by a timeout (the deadline, a socket timeout, or PyMySQL's 2013 lost connection during the query)
+    if type(error).__name__ in ("TimeoutError", "timeout"): return True
+    return type(error).__name__ == "OperationalError" and len(error.args) > 0 and error.args[0] == 2013
 
 def limit_db_rows(mysql_server,row_limit,timeout=2):
     mysql_query = ("DELETE FROM {} WHERE id NOT IN ( SELECT id FROM ( "
@@ -179,6 +323,197 @@ def limit_db_rows(mysql_server,row_limit,timeout=2):
                            mysql_server["table"],mysql_server["table"]))
     connect_mysql(mysql_server,mysql_query,[row_limit],timeout)
 
+#################################################################################################################
+## Store-and-forward queue of the rows to upload (SQLite)
+
+class outbox:
+    # Rows waiting for the upload in a SQLite database (WAL mode, so a power cut mid-write loses at most the last transaction).
+    # Every row gets a sequence number and the INSERT query it belongs to (layout), uploaded ranges are acknowledged (sent = 1),
+    # rows the server refuses for good are set aside (sent = 2) and old rows are compacted in batches. Until then the rows stay available for local queries (last rows, time range)
+    def __init__(self, path, synchronous="NORMAL"):
+        import sqlite3  # only needed by the upload worker, keep it out of the startup imports
+        self._db = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous={}".format(synchronous))
+        self._db.execute("CREATE TABLE IF NOT EXISTS layout (id INTEGER PRIMARY KEY, query TEXT UNIQUE NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS outbox (seq INTEGER PRIMARY KEY AUTOINCREMENT, time TEXT NOT NULL, "
+                         "layout INTEGER NOT NULL, data TEXT NOT NULL, sent INTEGER NOT NULL DEFAULT 0)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (seq) WHERE sent = 0")
+        self._db.execute("CREATE INDEX IF NOT EXISTS outbox_time ON outbox (time)")
+        self._layout = {}   # {INSERT query: layout id}, {layout id: INSERT query}
+
+    def get_layout(self, mysql_query):
+        if mysql_query not in self._layout:
+            self._db.execute("INSERT OR IGNORE INTO layout (query) VALUES (?)", (mysql_query,))
+            id = self._db.execute("SELECT id FROM layout WHERE query = ?", (mysql_query,)).fetchone()[0]
+            self._layout[mysql_query], self._layout[id] = id, mysql_query
+        return self._layout[mysql_query]
+
+    def put(self, rows):
+        # Insert [INSERT query, data, time string] rows in one transaction
+        self._db.execute("BEGIN")
+        try:
+            for mysql_query, data, timer in rows:
+                data = [strval(d) if isinstance(d,list) else d for d in data]
+                self._db.execute("INSERT INTO outbox (time, layout, data) VALUES (?, ?, ?)",
+                                 (timer, self.get_layout(mysql_query), json.dumps(data, default=str)))
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def pending(self, limit=500):
+        # Get the oldest rows not uploaded yet that share one INSERT query: [INSERT query, first seq, last seq, rows] (None if none)
+        result = self._db.execute("SELECT seq, layout, data FROM outbox WHERE sent = 0 ORDER BY seq LIMIT ?", (limit,)).fetchall()
+        if not result: return None
+        rows = []
+        for seq, layout, data in result:
+            if layout != result[0][1]: break
+            rows.append(json.loads(data)); last = seq
+        if result[0][1] not in self._layout:
+            mysql_query = self._db.execute("SELECT query FROM layout WHERE id = ?", (result[0][1],)).fetchone()[0]
+            self._layout[mysql_query], self._layout[result[0][1]] = result[0][1], mysql_query
+        return [self._layout[result[0][1]], result[0][0], last, rows]
+
+    def ack(self, first, last):
+        # Acknowledge the uploaded rows first..last (sequence numbers)
+        self._db.execute("UPDATE outbox SET sent = 1 WHERE seq BETWEEN ? AND ? AND sent = 0", (first, last))
+
+    def reject(self, first, last):
+        # Set aside the rows first..last (sequence numbers) after a permanent error, they stay for local queries and the CSV log
+        self._db.execute("UPDATE outbox SET sent = 2 WHERE seq BETWEEN ? AND ? AND sent = 0", (first, last))
+
+    def count_pending(self):
+        return self._db.execute("SELECT COUNT(*) FROM outbox WHERE sent = 0").fetchone()[0]
+
+    def compact(self, oldest, batch=1000):
+        # Delete the rows older than the time string 'oldest' (uploaded or not, like the CSV log), one short transaction per batch
+        while self._db.execute("DELETE FROM outbox WHERE seq IN (SELECT seq FROM outbox WHERE time < ? ORDER BY seq LIMIT ?)",
+                               (oldest, batch)).rowcount >= batch: pass
+
+    def last(self, n=1):
+        # Get the latest n rows as [seq, time, data, sent], oldest first (for the display and diagnostics)
+        rows = self._db.execute("SELECT seq, time, data, sent FROM outbox ORDER BY seq DESC LIMIT ?", (n,)).fetchall()
+        return [[seq, timer, json.loads(data), sent] for seq, timer, data, sent in reversed(rows)]
+
+    def range(self, start, end):
+        # Get the rows with start <= time <= end (time strings '%Y-%m-%d %H:%M:%S') as [seq, time, data, sent]
+        rows = self._db.execute("SELECT seq, time, data, sent FROM outbox WHERE time BETWEEN ? AND ? ORDER BY seq", (start, end)).fetchall()
+        return [[seq, timer, json.loads(data), sent] for seq, timer, data, sent in rows]
+
+class uploader:
+    # Background upload worker: the polling loop only puts a row into a queue, this thread writes it to the CSV journal
+    # and to the SQLite outbox (the durable queue) and uploads the outbox, so a slow or broken uplink never delays a poll.
+    # The polling loop never takes the lock of the worker, if more than size rows wait (back-pressure), the worker saves them
+    # between two upload batches, so the rows always reach the outbox in order.
+    # self.status = {"queue":rows in the queue, "backlog":outbox rows not uploaded, "uploaded", "overflow":rows queued beyond size,
+    #                "rejected":rows set aside after a permanent error}
+    def __init__(self, mysql_server, filename, timeout=2, size=64, retry_period=60):
+        self._mysql_server = mysql_server
+        self._filename     = filename
+        self._timeout      = timeout
+        self._retry_period = retry_period   # in seconds, retry the backlog this often even without a new row
+        self._size         = size
+        self._queue        = queue.Queue()     # unbounded, a put never blocks the polling loop
+        self._lock         = threading.Lock()  # journal/outbox writes and status of both threads
+        self._query        = None
+        self._outbox       = None
+        self._thread       = None
+        self._compacted    = None   # date of the last outbox compaction
+        self._deadline     = None   # deadline of the upload in progress, cancelled at shutdown
+        self._batch        = upload_batch   # rows of the next upload, halved after a failed upload and grown by 1/8 after a good one
+        self.status        = {"queue":0, "backlog":0, "uploaded":0, "overflow":0, "rejected":0}
+
+    def submit(self, mysql_query, title, data, timer):
+        # Queue a row from the polling loop, it never waits for the network (the outbox and the worker start with the first row)
+        self._query = mysql_query
+        if self._thread == None:
+            new = self.open_outbox()
+            self._thread = threading.Thread(target=self.run, args=(new,), daemon=True)
+            self._thread.start()
+        self._queue.put_nowait([mysql_query, title, data, timer])
+        self.status["queue"] = self._queue.qsize()
+        if self.status["queue"] > self._size: self.status["overflow"] += 1
+
+    def open_outbox(self):
+        # Open save/<log name>.sqlite, check if it is new
+        path = os.path.join(log_directory, os.path.splitext(self._filename)[0] + '.sqlite')
+        new = not os.path.exists(path)
+        self._outbox = outbox(path)
+        return new
+
+    def import_backlog(self):
+        # A new outbox takes over the rows of the CSV journal that were never uploaded (in the worker thread, it may be long),
+        # every row with the INSERT query of the title of its segment
+        with self._lock:
+            timer = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._outbox.put([[insert_query(self._mysql_server["table"], title), row, timer] for title, row in read_backlog(self._filename)])
+            self.status["backlog"] = self._outbox.count_pending()
+
+    def save_rows(self, rows):
+        # Write [INSERT query, title, data, timer] rows to the CSV journal and to the outbox
+        with self._lock:
+            for mysql_query, title, data, timer in rows: log_in_csv(title, data, timer, self._filename)
+            self._outbox.put([[mysql_query, data, timer.strftime('%Y-%m-%d %H:%M:%S')] for mysql_query, title, data, timer in rows])
+            self.status["backlog"] += len(rows)
+
+    def handle_queue(self, block):
+        # Save the queued rows (waiting up to self._retry_period for the first one if block)
+        rows = []
+        try:
+            rows.append(self._queue.get(timeout=self._retry_period) if block else self._queue.get_nowait())
+            while True: rows.append(self._queue.get_nowait())
+        except queue.Empty: pass
+        if rows: self.save_rows(rows)
+        self.status["queue"] = self._queue.qsize()
+
+    def handle_upload(self):
+        # Upload the outbox in transactions of up to upload_batch rows until it is empty or an upload fails.
+        # The timeout of a batch grows with its rows, a batch that still times out (a slow uplink) is halved for the next try,
+        # down to one row. A batch failing with a permanent error is set aside, so it never blocks the rows after it
+        while True:
+            # Save the rows waiting behind a long upload first
+            if self._queue.qsize() >= self._size: self.handle_queue(False)
+            with self._lock: batch = self._outbox.pending(self._batch)
+            if batch == None: break
+            mysql_query, first, last, rows = batch
+            self._deadline = deadline(self._timeout + len(rows)*upload_row_time)
+            error = None if connect_mysql(self._mysql_server, mysql_query, rows, many=True, limit=self._deadline) else mysql_error.get(threading.get_ident())
+            if error == None:
+                self._batch = min(self._batch + self._batch//8 + 1, upload_batch)
+                with self._lock:
+                    self._outbox.ack(first, last)
+                    self.status["uploaded"] += len(rows)
+                    self.status["backlog"] = self._outbox.count_pending()
+            elif is_permanent(error):
+                print(" -- {} rows are set aside, the MySQL table refuses them --".format(len(rows)))
+                with self._lock:
+                    self._outbox.reject(first, last)
+                    self.status["rejected"] += len(rows)
+                    self.status["backlog"] = self._outbox.count_pending()
+            else:
+                # A server out of reach fails the same way with any batch, only a timeout halves it
+                if is_timeout(error): self._batch = max(len(rows)//2, 1)
+                break
+
+    def run(self, new=False):
+        if new: self.import_backlog()
+        else:
+            with self._lock: self.status["backlog"] = self._outbox.count_pending()
+        while True:
+            self.handle_queue(True)
+            if self.status["backlog"] > 0: self.handle_upload()
+            # Compact the outbox once a day, the rows are kept as long as the CSV log
+            today = datetime.date.today()
+            if self._compacted != today:
+                self._compacted = today
+                with self._lock: self._outbox.compact((today - datetime.timedelta(days=log_limit)).strftime('%Y-%m-%d'))
+
+    def close(self):
+        # Stop the upload in progress and save the rows still in the queue (at shutdown), they are uploaded after the restart
+        if self._deadline != None: self._deadline.cancel()
+        if self._outbox != None: self.handle_queue(False)
+
 #################################################################################################################
 ## Calculate uptime and downtime using MySQL
 